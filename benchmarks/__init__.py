@@ -0,0 +1,14 @@
+"""
+Benchmarks for qrenderer
+
+Run all the benchmarks with
+
+```console
+$ python -m benchmarks
+```
+
+or a single suite with e.g. `python -m benchmarks format`. The
+`scaling` suite builds the documentation of synthetic packages of
+increasing size and reports the throughput and peak memory. Use the
+`--json` option to save the results in a machine-readable form.
+"""
@@ -0,0 +1,5 @@
+from ._harness import main
+
+SUITES = ("format", "imports", "scaling", "sections", "tables")
+
+main(SUITES)
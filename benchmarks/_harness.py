@@ -0,0 +1,243 @@
+"""
+Running benchmarks and reporting the results
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import timeit
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from fnmatch import fnmatchcase
+from importlib import import_module
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from typing import Any
+
+
+@dataclass
+class Benchmark:
+    """
+    A function to time
+    """
+
+    name: str
+    """Name of the benchmark, unique within a suite"""
+
+    func: Callable[[], object]
+    """Function to time. It is called without arguments"""
+
+    number: int | None = None
+    """
+    Number of calls in each timing run
+
+    If None, it is chosen so that a run takes at least 0.2 seconds.
+    Set it for expensive functions that need not be called many times.
+    """
+
+    counts: Callable[[], dict[str, int]] | None = None
+    """
+    Return the number of things (e.g. pages) that a call processes
+
+    It is called after the timing, and the counts are used to report
+    the throughput.
+    """
+
+    memory: bool = False
+    """Whether to measure the peak memory used by a call"""
+
+
+@dataclass
+class Result:
+    """
+    Timing of a benchmark
+
+    All times are per call and in seconds.
+    """
+
+    suite: str
+    name: str
+    number: int
+    repeat: int
+    min: float
+    median: float
+    mean: float
+    stdev: float
+    throughput: dict[str, float] = field(default_factory=dict)
+    """Number of things processed per second, using the median time"""
+    peak_memory: int | None = None
+    """Peak memory allocated by a call, in bytes"""
+
+
+def time_benchmark(suite: str, bench: Benchmark, repeat: int) -> Result:
+    """
+    Time a benchmark
+
+    Unless the benchmark sets it, the number of calls in each timing
+    run is chosen so that a run takes at least 0.2 seconds.
+    """
+    timer = timeit.Timer(bench.func)
+    number = bench.number or timer.autorange()[0]
+    times = [t / number for t in timer.repeat(repeat, number)]
+    median = statistics.median(times)
+    counts = bench.counts() if bench.counts else {}
+    return Result(
+        suite=suite,
+        name=bench.name,
+        number=number,
+        repeat=repeat,
+        min=min(times),
+        median=median,
+        mean=statistics.mean(times),
+        stdev=statistics.stdev(times) if repeat > 1 else 0.0,
+        throughput={k: n / median for k, n in counts.items()},
+        peak_memory=peak_memory(bench.func) if bench.memory else None,
+    )
+
+
+def peak_memory(func: Callable[[], object]) -> int:
+    """
+    Return the peak memory allocated by python during a call to func
+    """
+    tracemalloc.start()
+    try:
+        _ = func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def format_memory(n: float) -> str:
+    """
+    Format a number of bytes with a suitable unit
+    """
+    for unit in ("B", "KiB", "MiB"):
+        if n < 1024:
+            return f"{n:.3g} {unit}"
+        n /= 1024
+    return f"{n:.3g} GiB"
+
+
+def format_time(t: float) -> str:
+    """
+    Format a duration in seconds with a suitable unit
+    """
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if t >= scale:
+            return f"{t / scale:.3g} {unit}"
+    return f"{t / 1e-9:.3g} ns"
+
+
+def run_suites(
+    suites: Sequence[str],
+    pattern: str = "*",
+    repeat: int = 5,
+) -> list[Result]:
+    """
+    Run the benchmarks in suites and print a summary of the timings
+
+    Parameters
+    ----------
+    suites :
+        Names of the modules in this package. Each module has a
+        `benchmarks` function that returns a list of
+        [](`~benchmarks._harness.Benchmark`).
+    pattern :
+        Only run benchmarks whose names match this glob pattern.
+    repeat :
+        Number of timing runs for each benchmark.
+    """
+    results: list[Result] = []
+    for suite in suites:
+        module = import_module(f"benchmarks.{suite}")
+        for bench in module.benchmarks():
+            if not fnmatchcase(bench.name, pattern):
+                continue
+            res = time_benchmark(suite, bench, repeat)
+            results.append(res)
+            extra = [f"{n:.4g} {k}/s" for k, n in res.throughput.items()]
+            if res.peak_memory is not None:
+                extra.append(f"{format_memory(res.peak_memory)} peak")
+            print(
+                f"{suite}.{res.name:<40} "
+                f"{format_time(res.min):>10} (min) "
+                f"{format_time(res.median):>10} (median)",
+                *extra,
+                sep="  ",
+                file=sys.stderr,
+            )
+    return results
+
+
+def report(results: Sequence[Result]) -> dict[str, Any]:
+    """
+    Return results together with the environment they were collected in
+    """
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        qrenderer_version = version("qrenderer")
+    except PackageNotFoundError:
+        qrenderer_version = ""
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "qrenderer": qrenderer_version,
+        "results": [asdict(r) for r in results],
+    }
+
+
+def main(all_suites: Sequence[str], argv: Sequence[str] | None = None):
+    """
+    Command line interface to run the benchmarks
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Run qrenderer benchmarks",
+    )
+    parser.add_argument(
+        "suites",
+        nargs="*",
+        help=(
+            f"Suites to run, any of {', '.join(all_suites)}. "
+            "The default is to run all of them."
+        ),
+    )
+    parser.add_argument(
+        "-k",
+        "--filter",
+        default="*",
+        help="Only run the benchmarks whose names match this glob pattern.",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of timing runs for each benchmark.",
+    )
+    parser.add_argument(
+        "--json",
+        metavar="FILE",
+        help="Write the results as json to FILE ('-' for stdout).",
+    )
+    args = parser.parse_args(argv)
+    if unknown := set(args.suites) - set(all_suites):
+        parser.error(f"Unknown suites: {', '.join(sorted(unknown))}")
+
+    results = run_suites(args.suites or all_suites, args.filter, args.repeat)
+    if args.json:
+        data = json.dumps(report(results), indent=2)
+        if args.json == "-":
+            print(data)
+        else:
+            _ = Path(args.json).write_text(data, encoding="utf-8")
@@ -0,0 +1,201 @@
+"""
+Generating synthetic packages to document
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from textwrap import indent
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
+
+
+TYPING_MODULE = '''\
+"""
+Types used in the package
+"""
+
+from typing import Protocol, TypeAlias, TypeVar
+
+T = TypeVar("T")
+"""A type variable"""
+
+Scalar: TypeAlias = int | float | str
+"""A scalar value"""
+
+Nested: TypeAlias = dict[str, list[tuple[int, Scalar | None]]]
+"""A nested container"""
+
+
+class SupportsRender(Protocol):
+    """
+    An object that can be rendered
+    """
+
+    def render(self) -> str:
+        """
+        Render the object
+        """
+        ...
+'''
+
+
+@dataclass
+class SyntheticPackage:
+    """
+    Specification of a package with a regular structure
+
+    Every module has the same number of classes and functions. The
+    classes in a module form chains of inheritance, and every class
+    adds its own methods to those of its bases.
+    """
+
+    name: str
+    """Name of the package"""
+
+    modules: int = 4
+    """Number of modules"""
+
+    classes: int = 8
+    """Number of classes in each module"""
+
+    methods: int = 4
+    """Number of methods of each class, excluding inherited methods"""
+
+    functions: int = 4
+    """Number of functions in each module"""
+
+    inheritance_depth: int = 1
+    """
+    Length of the chains of inheritance
+
+    With 1, no class inherits from another class in the package.
+    """
+
+    docstring_lines: int = 4
+    """Number of lines in the description of each docstring"""
+
+    def write(self, directory: Path) -> Path:
+        """
+        Write the package into directory
+
+        Returns
+        -------
+        :
+            The directory of the package
+        """
+        pkg_dir = directory / self.name
+        pkg_dir.mkdir(parents=True, exist_ok=True)
+        _ = (pkg_dir / "__init__.py").write_text(
+            f'"""\nSynthetic package {self.name}\n"""\n'
+        )
+        _ = (pkg_dir / "typing.py").write_text(TYPING_MODULE)
+        for i in range(self.modules):
+            _ = (pkg_dir / f"module_{i}.py").write_text(self.module_code(i))
+        return pkg_dir
+
+    def module_code(self, i: int) -> str:
+        """
+        Return the source code of the i'th module
+        """
+        parts = [
+            f'"""\n{self.description(f"Module {i}")}\n"""\n',
+            "from __future__ import annotations\n",
+            f"from {self.name}.typing import Nested, Scalar, T\n",
+        ]
+        parts.extend(
+            self.function_code(f"func_{j}") for j in range(self.functions)
+        )
+        parts.extend(self.class_code(j) for j in range(self.classes))
+        return "\n\n".join(parts)
+
+    def class_code(self, j: int) -> str:
+        """
+        Return the source code of the j'th class in a module
+        """
+        base = f"(Class_{j - 1})" if j % self.inheritance_depth else ""
+        docstring = self.docstring(
+            f"Class {j}",
+            "scale : Scalar\n    How much to scale by",
+        )
+        init = (
+            "def __init__(self, scale: Scalar = 1):\n    self.scale = scale\n"
+        )
+        methods = [
+            self.function_code(f"method_{j}_{k}", method=True)
+            for k in range(self.methods)
+        ]
+        body = "\n".join([f"{docstring}\n", init, *methods])
+        return f"class Class_{j}{base}:\n{indent(body, ' ' * 4)}"
+
+    def function_code(self, name: str, method: bool = False) -> str:
+        """
+        Return the source code of a function or method
+        """
+        self_ = "self, " if method else ""
+        docstring = self.docstring(
+            f"Function {name}",
+            "x : T\n    The input\n"
+            "values : Nested\n    Nested values\n"
+            "flag : bool\n    Whether to do it",
+            "Scalar\n    The result",
+        )
+        signature = (
+            f"def {name}(\n"
+            f"    {self_}x: T,\n"
+            "    values: Nested | None = None,\n"
+            "    *,\n"
+            "    flag: bool = False,\n"
+            ") -> Scalar:\n"
+        )
+        body = f"{docstring}\nreturn 0\n"
+        return signature + indent(body, " " * 4)
+
+    def description(self, title: str) -> str:
+        """
+        Return the description of an object
+        """
+        lines = [f"{title}"] + [
+            f"Line {i} of the description of {title.lower()}, "
+            "it has `code` and *emphasis*."
+            for i in range(self.docstring_lines)
+        ]
+        return "\n\n".join(lines[:1] + ["\n".join(lines[1:])])
+
+    def docstring(
+        self, title: str, parameters: str, returns: str | None = None
+    ) -> str:
+        """
+        Return a numpydoc docstring
+        """
+        sections = [
+            self.description(title),
+            f"Parameters\n----------\n{parameters}",
+        ]
+        if returns:
+            sections.append(f"Returns\n-------\n{returns}")
+        return '"""\n' + "\n\n".join(sections) + '\n"""'
+
+    def quartodoc_config(self) -> dict[str, Any]:
+        """
+        Return the quartodoc configuration to document the package
+        """
+        sections = [
+            {
+                "title": f"Module {i}",
+                "contents": [
+                    *(f"module_{i}.func_{j}" for j in range(self.functions)),
+                    *(f"module_{i}.Class_{j}" for j in range(self.classes)),
+                ],
+            }
+            for i in range(self.modules)
+        ]
+        return {
+            "package": self.name,
+            "dir": "reference",
+            "options": {"include_inherited": True},
+            "sections": sections,
+        }
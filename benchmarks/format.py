@@ -0,0 +1,199 @@
+"""
+Benchmarks of the functions in qrenderer._format
+
+These functions run once for every parameter, attribute or annotation
+of every documented object, so small regressions in them multiply
+across thousands of objects.
+"""
+
+from __future__ import annotations
+
+from textwrap import dedent, indent
+from typing import TYPE_CHECKING, cast
+
+import griffe as gf
+
+from qrenderer._format import (
+    format_see_also,
+    formatted_signature,
+    highlight_strings,
+    pretty_code,
+    render_attribute_declaration,
+    render_dataclass_parameter,
+    repr_obj,
+)
+
+from ._harness import Benchmark
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def nested_generic(depth: int) -> str:
+    """
+    Return an annotation with generics nested depth levels deep
+
+    e.g. depth=2 gives `dict[str, list[Optional[tuple[int, str]]]]`
+    """
+    types = ("dict[str, {}]", "list[{}]", "Optional[{}]", "Sequence[{}]")
+    annotation = "tuple[int, str]"
+    for i in range(depth):
+        annotation = types[i % len(types)].format(annotation)
+    return annotation
+
+
+def long_signature_code(n: int) -> str:
+    """
+    Return code for a function with n parameters of all kinds
+    """
+    params: list[str] = []
+    for i in range(n):
+        if i == n // 4:
+            params.append("/")
+        elif i == n // 2:
+            params.append("*")
+        match i % 4:
+            case 0:
+                params.append(f"p{i}: int = {i}")
+            case 1:
+                params.append(f"p{i}: str = 'value \"{i}\"'")
+            case 2:
+                params.append(f"p{i}: {nested_generic(3)} = None")
+            case _ if i > n // 2:
+                # Keyword-only, so it can come after the defaults
+                params.append(f"p{i}")
+            case _:
+                params.append(f"p{i}: bool = True")
+    return f"def func({', '.join(params)}): ..."
+
+
+def dataclass_code(n: int) -> str:
+    """
+    Return code for a dataclass with n fields with multi-line defaults
+    """
+    fields: list[str] = []
+    for i in range(n):
+        fields.append(
+            dedent(
+                f"""\
+                field_{i}: {nested_generic(4)} = field(
+                    default_factory=lambda: {{
+                        "key_{i}": [1, 2, 3],
+                        'other "{i}"': None,
+                    }}
+                )
+                \"\"\"Field {i}\"\"\"
+                """
+            )
+        )
+    body = indent("\n".join(fields), " " * 4)
+    return dedent(
+        """\
+        from dataclasses import dataclass, field
+        from typing import Optional, Sequence, TypeAlias
+
+        Nested: TypeAlias = {annotation}
+
+        @dataclass
+        class Data:
+        {body}
+        """
+    ).format(annotation=nested_generic(8), body=body)
+
+
+def see_also_text(n: int) -> str:
+    """
+    Return the content of a See Also section with n entries
+    """
+    lines: list[str] = []
+    for i in range(n):
+        if i % 3 == 0:
+            lines.append(f"package.module_{i}.func_{i}, package.Class_{i}")
+        elif i % 3 == 1:
+            lines.append(f"package.module_{i}.Class_{i} : Description {i}")
+        else:
+            lines.append(
+                f"package.func_{i} : A description of func {i} that is\n"
+                "    long enough to go onto the next line."
+            )
+    return "\n".join(lines)
+
+
+def code_with_strings(n: int) -> str:
+    """
+    Return multi-line code with n string literals
+    """
+    lines = [
+        f"    {{'key_{i}': \"value with 'quotes' {i}\", 'escaped \\' {i}': 0}}"
+        for i in range(n)
+    ]
+    return "\n".join(["[", *lines, "]"])
+
+
+def _load(code: str) -> gf.Module:
+    """
+    Load code as a module
+    """
+    with gf.temporary_visited_package(
+        "package", {"__init__.py": code}, docstring_parser="numpy"
+    ) as m:
+        return m
+
+
+def _rendered_parameters(func: gf.Function) -> Iterator[str]:
+    for p in func.parameters:
+        default = f"={repr_obj(p.default)}" if p.default else ""
+        yield f"{p.name}{default}"
+
+
+def benchmarks() -> list[Benchmark]:
+    """
+    Create the benchmarks
+    """
+    func = cast("gf.Function", _load(long_signature_code(40))["func"])
+    module = _load(dataclass_code(20))
+    nested_alias = cast("gf.Attribute", module["Nested"])
+    data_class = cast("gf.Class", module["Data"])
+    param = data_class.parameters["field_0"]
+    attr = cast("gf.Attribute", data_class.attributes["field_0"])
+    nested_expr = cast("gf.Expr", func.parameters["p2"].annotation)
+    default_expr = cast("gf.Expr", param.default)
+
+    signature_params = list(_rendered_parameters(func))
+    code = code_with_strings(20)
+    default = "'a \"quoted\" string'"
+    see_also = see_also_text(20)
+
+    return [
+        Benchmark("pretty_code_default", lambda: pretty_code(default)),
+        Benchmark("pretty_code_multiline", lambda: pretty_code(code)),
+        # Without the cache of the results
+        Benchmark(
+            "pretty_code_default_uncached",
+            lambda: pretty_code.__wrapped__(default),
+        ),
+        Benchmark(
+            "pretty_code_multiline_uncached",
+            lambda: pretty_code.__wrapped__(code),
+        ),
+        Benchmark("highlight_strings", lambda: highlight_strings(code)),
+        Benchmark("format_see_also", lambda: format_see_also(see_also)),
+        Benchmark(
+            "formatted_signature_short",
+            lambda: formatted_signature("func", signature_params[:3]),
+        ),
+        Benchmark(
+            "formatted_signature_long",
+            lambda: formatted_signature("func", signature_params),
+        ),
+        Benchmark(
+            "render_attribute_declaration",
+            lambda: render_attribute_declaration(nested_alias),
+        ),
+        Benchmark(
+            "render_dataclass_parameter",
+            lambda: render_dataclass_parameter(param, attr),
+        ),
+        Benchmark("repr_obj_nested_annotation", lambda: repr_obj(nested_expr)),
+        Benchmark("repr_obj_default", lambda: repr_obj(default_expr)),
+    ]
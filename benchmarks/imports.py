@@ -0,0 +1,39 @@
+"""
+Benchmarks of the time it takes to start using qrenderer
+
+Each benchmark imports in a fresh python process, so the timings
+include starting the interpreter. The `python` benchmark only starts
+the interpreter and it is the baseline for the others.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from ._harness import Benchmark
+
+STATEMENTS = {
+    "python": "pass",
+    "import_qrenderer": "import qrenderer",
+    "import_qrenderer_typing": "import qrenderer.typing",
+    "import_qrenderer_render": "from qrenderer import RenderDocClass",
+    "import_qrenderer_renderer": "from qrenderer import QRenderer",
+}
+
+
+def run(statement: str):
+    """
+    Run a statement in a new python process
+    """
+    _ = subprocess.run([sys.executable, "-c", statement], check=True)
+
+
+def benchmarks() -> list[Benchmark]:
+    """
+    Create the benchmarks
+    """
+    return [
+        Benchmark(name, lambda s=statement: run(s), number=1)
+        for name, statement in STATEMENTS.items()
+    ]
@@ -0,0 +1,108 @@
+"""
+End-to-end benchmarks of building the documentation of a package
+
+The same synthetic package is built at increasing sizes with the
+quartodoc Builder and qrenderer as the renderer. If the rendering
+scales linearly with the size of the package, the throughput (pages/s
+and objects/s) is about the same at all sizes.
+"""
+
+from __future__ import annotations
+
+import atexit
+import shutil
+import sys
+import tempfile
+from contextlib import chdir
+from pathlib import Path
+
+from quartodoc import Builder, blueprint, collect
+
+from qrenderer import QRenderer
+
+from ._harness import Benchmark
+from ._package import SyntheticPackage
+
+# The number of modules grows, everything else is fixed so that the
+# pages are alike at every size.
+SIZES = {
+    "small": 2,
+    "medium": 8,
+    "large": 32,
+}
+
+
+class BuildBenchmark:
+    """
+    Build the documentation of a synthetic package
+
+    The package is written to a temporary directory when the benchmark
+    first runs, and the directory is removed when python exits.
+    """
+
+    def __init__(self, package: SyntheticPackage):
+        self.package = package
+        self._directory: Path | None = None
+
+    @property
+    def directory(self) -> Path:
+        """
+        Directory with the package and the built documentation
+        """
+        if self._directory is None:
+            self._directory = Path(tempfile.mkdtemp(prefix="qrenderer-"))
+            atexit.register(shutil.rmtree, self._directory, True)
+            _ = self.package.write(self._directory)
+            sys.path.insert(0, str(self._directory))
+        return self._directory
+
+    def builder(self) -> Builder:
+        """
+        Create a builder for the package
+        """
+        renderer = QRenderer(
+            typing_module_paths=[f"{self.package.name}.typing"]
+        )
+        return Builder(**self.package.quartodoc_config(), renderer=renderer)
+
+    def __call__(self):
+        with chdir(self.directory):
+            self.builder().build()
+
+    def counts(self) -> dict[str, int]:
+        """
+        Return the number of pages and objects in the documentation
+        """
+        with chdir(self.directory):
+            builder = self.builder()
+            pages, items = collect(blueprint(builder.layout), builder.dir)
+        return {"pages": len(pages), "objects": len(items)}
+
+
+def benchmarks() -> list[Benchmark]:
+    """
+    Create the benchmarks
+    """
+    benches: list[Benchmark] = []
+    for size, modules in SIZES.items():
+        build = BuildBenchmark(
+            SyntheticPackage(
+                f"synthetic_{size}",
+                modules=modules,
+                classes=8,
+                methods=4,
+                functions=4,
+                inheritance_depth=3,
+                docstring_lines=4,
+            )
+        )
+        benches.append(
+            Benchmark(
+                f"build_{size}",
+                build,
+                number=1,
+                counts=build.counts,
+                memory=True,
+            )
+        )
+    return benches
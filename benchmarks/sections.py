@@ -0,0 +1,90 @@
+"""
+Benchmarks of dispatching the rendering of docstring sections
+
+Every section of every docstring is rendered by the method registered
+for its type on RenderDoc.render_section. The sections in these
+benchmarks are cheap to render, so the timings are mostly the overhead
+of the dispatch.
+"""
+
+from __future__ import annotations
+
+from functools import singledispatchmethod
+from typing import TYPE_CHECKING
+
+import griffe as gf
+
+from qrenderer import QRenderer, RenderDoc, RenderDocFunction
+from qrenderer._utils import griffe_to_doc
+
+from ._harness import Benchmark
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+CODE = '''
+def func(a: int):
+    """
+    A function
+
+    Parameters
+    ----------
+    a :
+        Parameter a
+    """
+'''
+
+
+def section_renderers() -> tuple[
+    list[gf.DocstringSection],
+    Callable[[gf.DocstringSection], object],
+    Callable[[gf.DocstringSection], object],
+]:
+    """
+    Return the sections of a docstring and two ways to render them
+
+    The first is RenderDoc.render_section, and the second dispatches
+    to the same registered methods with functools.singledispatchmethod,
+    which is what qrenderer used to do.
+    """
+    with gf.temporary_visited_package(
+        "package", {"__init__.py": CODE}, docstring_parser="numpy"
+    ) as m:
+        doc = griffe_to_doc(m["func"])
+        render = RenderDocFunction(doc, QRenderer())
+        sections = render.renderer.section_cache.transform(
+            render.obj.docstring  # pyright: ignore[reportArgumentType]
+        )
+
+    # Only the text sections are cheap to render
+    sections = [s for s in sections if isinstance(s, gf.DocstringSectionText)]
+
+    old = singledispatchmethod(RenderDoc.render_section.func)
+    old.dispatcher = RenderDoc.render_section.dispatcher
+
+    def render_old(section: gf.DocstringSection) -> object:
+        return old.__get__(render, type(render))(section)
+
+    def render_new(section: gf.DocstringSection) -> object:
+        return render.render_section(section)
+
+    return sections, render_new, render_old
+
+
+def benchmarks() -> list[Benchmark]:
+    """
+    Create the benchmarks
+    """
+    sections, render_new, render_old = section_renderers()
+
+    def dispatch(render: Callable[[gf.DocstringSection], object]):
+        for section in sections:
+            render(section)
+
+    return [
+        Benchmark("render_section", lambda: dispatch(render_new)),
+        # For comparison, what qrenderer used to do
+        Benchmark(
+            "render_section_singledispatch", lambda: dispatch(render_old)
+        ),
+    ]
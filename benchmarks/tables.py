@@ -0,0 +1,51 @@
+"""
+Benchmarks of writing the summary tables
+
+The summary of a module or class has a row for every member, and each
+row has the interlink markdown of the member.
+"""
+
+from __future__ import annotations
+
+from tabulate import tabulate
+
+from qrenderer._pandoc.tables import grid_table
+
+from ._harness import Benchmark
+
+
+def summary_rows(n: int) -> list[tuple[str, str]]:
+    """
+    Return n rows of a summary table
+    """
+    return [
+        (
+            f"[method_{i}](`package.module.Class.method_{i}`)",
+            f"Description of method {i} that is about as long as a line",
+        )
+        for i in range(n)
+    ]
+
+
+def benchmarks() -> list[Benchmark]:
+    """
+    Create the benchmarks
+    """
+    headers = ("Name", "Description")
+    benches: list[Benchmark] = []
+    for n in (10, 300):
+        rows = summary_rows(n)
+        benches.extend(
+            [
+                Benchmark(
+                    f"grid_table_{n}_rows",
+                    lambda rows=rows: grid_table(rows, headers),
+                ),
+                # For comparison, what qrenderer used to do
+                Benchmark(
+                    f"tabulate_{n}_rows",
+                    lambda rows=rows: tabulate(rows, headers, "grid"),
+                ),
+            ]
+        )
+    return benches
@@ -1,20 +1,26 @@
-from ._qrenderer import QRenderer
-from ._render.doc import RenderDoc
-from ._render.docattribute import RenderDocAttribute
-from ._render.docclass import RenderDocClass
-from ._render.docfunction import RenderDocFunction
-from ._render.docmodule import RenderDocModule
-from ._render.extending import (
-    exclude_attributes,
-    exclude_classes,
-    exclude_functions,
-    exclude_parameters,
-)
-from ._render.layout import RenderLayout
-from ._render.mixin_call import RenderDocCallMixin
-from ._render.mixin_members import RenderDocMembersMixin
-from ._render.page import RenderPage
-from ._render.section import RenderSection
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._qrenderer import QRenderer
+    from ._render.doc import RenderDoc
+    from ._render.docattribute import RenderDocAttribute
+    from ._render.docclass import RenderDocClass
+    from ._render.docfunction import RenderDocFunction
+    from ._render.docmodule import RenderDocModule
+    from ._render.extending import (
+        exclude_attributes,
+        exclude_classes,
+        exclude_functions,
+        exclude_parameters,
+    )
+    from ._render.layout import RenderLayout
+    from ._render.mixin_call import RenderDocCallMixin
+    from ._render.mixin_members import RenderDocMembersMixin
+    from ._render.page import RenderPage
+    from ._render.section import RenderSection
 
 __all__ = (
     "QRenderer",
@@ -33,3 +39,40 @@ __all__ = (
     "exclude_functions",
     "exclude_parameters",
 )
+
+# The module that defines each name in the public API. The modules
+# import griffe & quartodoc, which take most of the time to import
+# qrenderer, so they are imported when one of their names is first used.
+_MODULES = {
+    "QRenderer": "._qrenderer",
+    "RenderDoc": "._render.doc",
+    "RenderDocClass": "._render.docclass",
+    "RenderDocFunction": "._render.docfunction",
+    "RenderDocAttribute": "._render.docattribute",
+    "RenderDocModule": "._render.docmodule",
+    "RenderDocCallMixin": "._render.mixin_call",
+    "RenderDocMembersMixin": "._render.mixin_members",
+    "RenderLayout": "._render.layout",
+    "RenderPage": "._render.page",
+    "RenderSection": "._render.section",
+    "exclude_attributes": "._render.extending",
+    "exclude_classes": "._render.extending",
+    "exclude_functions": "._render.extending",
+    "exclude_parameters": "._render.extending",
+}
+
+
+def __getattr__(name: str):
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
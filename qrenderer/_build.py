@@ -0,0 +1,146 @@
+"""
+Building the documentation
+"""
+
+from __future__ import annotations
+
+import sys
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+from ._utils import write_if_changed
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import sphobjinv as soi
+    from quartodoc import Builder, layout
+
+    from ._qrenderer import QRenderer
+
+
+def build(
+    builder: Builder,
+    blueprint: layout.Layout | None = None,
+    filter: str = "*",
+):
+    """
+    Build the documentation
+
+    These are the steps of quartodoc's `Builder.build`, but only the
+    files whose content has changed are written.
+
+    Parameters
+    ----------
+    builder :
+        Builder of the documentation. Its renderer must be a QRenderer.
+    blueprint :
+        The blueprint of the documentation. If None, it is created from
+        the layout of the builder.
+    filter :
+        Only render and write the pages whose paths match this pattern.
+    """
+    from quartodoc import collect, layout
+    from quartodoc.builder.blueprint import BlueprintTransformer
+
+    if blueprint is None:
+        if builder.source_dir:
+            sys.path.append(builder.source_dir)
+        trans = BlueprintTransformer(parser=builder.parser)
+        if builder.dynamic is not None:
+            trans.dynamic = builder.dynamic
+        blueprint = trans.visit(builder.layout)
+
+    if not isinstance(blueprint, layout.Layout):
+        msg = "The blueprint of the documentation is not a Layout."
+        raise TypeError(msg)
+
+    renderer = cast("QRenderer", builder.renderer)
+    renderer.page_filter = filter
+    pages, builder.items = collect(blueprint, base_dir=builder.dir)
+    write_index(builder, blueprint)
+    write_doc_pages(builder, pages, filter)
+    renderer._pages_written(builder)  # pyright: ignore[reportPrivateUsage]
+
+    write_inventory(builder)
+    if builder.sidebar:
+        write_sidebar(builder, blueprint)
+    if builder.css:
+        builder.write_css()
+
+
+def write_index(builder: Builder, blueprint: layout.Layout):
+    """
+    Write the index page of the API reference
+    """
+    from quartodoc.pandoc.blocks import Blocks, Header
+    from quartodoc.pandoc.components import Attr
+
+    renderer = cast("QRenderer", builder.renderer)
+    content = renderer.summarize(blueprint)
+    header = Header(1, builder.title, Attr(classes=["doc", "doc-index"]))
+    filepath = Path(builder.dir) / builder.out_index
+    _ = write_if_changed(filepath, str(Blocks([header, content])))
+
+
+def write_doc_pages(
+    builder: Builder,
+    pages: Sequence[layout.Page],
+    filter: str = "*",
+):
+    """
+    Write the pages that document the objects
+
+    Parameters
+    ----------
+    builder :
+        Builder of the documentation
+    pages :
+        The pages to write
+    filter :
+        Only render and write the pages whose paths match this pattern.
+    """
+    renderer = cast("QRenderer", builder.renderer)
+    for page in pages:
+        if not fnmatchcase(page.path, filter):
+            continue
+
+        content = renderer.render(page)
+        filepath = Path(builder.dir) / f"{page.path}{builder.out_page_suffix}"
+        if builder.rewrite_all_pages:
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            _ = filepath.write_text(content, encoding="utf-8")
+        else:
+            _ = write_if_changed(filepath, content)
+
+
+def write_inventory(builder: Builder):
+    """
+    Write the inventory of the documented objects
+
+    With the fast interlinks of quarto (`interlinks: fast: true`), the
+    inventory is written as text to a `.txt` file. Otherwise, it is
+    written as json.
+    """
+    from quartodoc.inventory import convert_inventory
+
+    inventory = cast("soi.Inventory", builder.create_inventory(builder.items))
+    if builder._fast_inventory:  # pyright: ignore[reportPrivateUsage]
+        import sphobjinv as soi
+
+        filepath = Path(builder.out_inventory).with_suffix(".txt")
+        soi.writebytes(filepath, inventory.data_file())
+    else:
+        convert_inventory(inventory, builder.out_inventory)
+
+
+def write_sidebar(builder: Builder, blueprint: layout.Layout):
+    """
+    Write the yaml configuration of the sidebar of the API reference
+    """
+    import yaml
+
+    sidebar = builder._generate_sidebar(blueprint)  # pyright: ignore[reportPrivateUsage]
+    filepath = Path(cast("dict[str, str]", builder.sidebar)["file"])
+    _ = write_if_changed(filepath, yaml.dump(sidebar))
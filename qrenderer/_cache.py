@@ -0,0 +1,259 @@
+"""
+Caching of rendered pages
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import sys
+from dataclasses import dataclass, fields
+from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING
+
+import griffe as gf
+from quartodoc import layout
+
+from ._utils import write_atomic
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+    from ._qrenderer import QRenderer
+
+
+# Fields of the renderer that do not affect the content of a page
+NON_CONTENT_FIELDS = {
+    "cache_dir",
+    "jobs",
+    "incremental",
+    "share_inherited_members",
+    "profile",
+    "manifest",
+    # The state of the renderer
+    "_rendered",
+    "_dependencies",
+    "annotation_cache",
+    "section_cache",
+    "member_cache",
+    "loader",
+    "_page_files",
+    "_index_file",
+    "page_filter",
+}
+
+
+@dataclass
+class PageCache:
+    """
+    An on-disk store of rendered pages
+
+    The pages are stored by a key that is derived from the content
+    that went into rendering them. See [](`~qrenderer._cache.page_key`).
+    """
+
+    directory: Path
+    """Directory where the rendered pages are stored"""
+
+    def _path(self, key: str) -> Path:
+        # Spread the files over subdirectories so that no one directory
+        # ends up with thousands of files
+        return self.directory / key[:2] / f"{key}.qmd"
+
+    def get(self, key: str) -> str | None:
+        """
+        Return the page stored at key or None if there is no page
+        """
+        try:
+            return self._path(key).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def set(self, key: str, content: str):
+        """
+        Store the content of a page at key
+        """
+        # An interrupted build must not leave behind a truncated page
+        # that would be served as a hit
+        write_atomic(self._path(key), content.encode("utf-8"))
+
+
+def renderer_fingerprint(renderer: QRenderer) -> str:
+    """
+    Return a hash of everything about the renderer that affects a page
+
+    This is the configuration of the renderer, the version of qrenderer,
+    the source of the module in which the renderer is defined (usually
+    `_renderer.py` with the customised Render classes) and the objects
+    excluded from the documentation.
+    """
+    from ._globals import (
+        EXCLUDE_ATTRIBUTES,
+        EXCLUDE_CLASSES,
+        EXCLUDE_FUNCTIONS,
+        EXCLUDE_PARAMETERS,
+    )
+
+    try:
+        qrenderer_version = version("qrenderer")
+    except PackageNotFoundError:
+        qrenderer_version = ""
+
+    try:
+        module = sys.modules[type(renderer).__module__]
+        source = inspect.getsource(module)
+    except (KeyError, OSError, TypeError):
+        source = ""
+
+    config = [
+        (f.name, getattr(renderer, f.name))
+        for f in fields(renderer)
+        if f.name not in NON_CONTENT_FIELDS
+    ]
+
+    excludes = [
+        sorted((str(k), str(v)) for k, v in spec.items())
+        for spec in (
+            EXCLUDE_ATTRIBUTES,
+            EXCLUDE_CLASSES,
+            EXCLUDE_FUNCTIONS,
+            EXCLUDE_PARAMETERS,
+        )
+    ]
+
+    return hash_tokens(
+        (
+            qrenderer_version,
+            type(renderer).__qualname__,
+            source,
+            repr(config),
+            repr(excludes),
+        )
+    )
+
+
+def page_key(page: layout.Page, salt: str, objects: bool = True) -> str:
+    """
+    Return a key that identifies the rendered content of a page
+
+    Parameters
+    ----------
+    page :
+        Page to be rendered
+    salt :
+        A fingerprint of the renderer.
+        See [](`~qrenderer._cache.renderer_fingerprint`).
+    objects :
+        Whether to include the griffe objects of the page. If False,
+        the key only identifies the structure of the page i.e. which
+        objects are documented and how they are laid out.
+    """
+    return hash_tokens(_layout_tokens(page, objects), salt)
+
+
+def hash_tokens(tokens: Iterable[str], salt: str = "") -> str:
+    """
+    Return a hash of a sequence of strings
+    """
+    h = hashlib.sha256(salt.encode())
+    for token in tokens:
+        h.update(token.encode())
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _layout_tokens(el: object, objects: bool) -> Iterator[str]:
+    """
+    Yield strings that describe a layout object and its contents
+    """
+    if isinstance(el, layout.Page):
+        summary = el.summary
+        yield f"page:{el.path}:{el.flatten}"
+        yield f"summary:{summary and summary.name}:{summary and summary.desc}"
+        for c in el.contents:
+            yield from _layout_tokens(c, objects)
+    elif isinstance(el, layout.Doc):
+        kind = getattr(el, "kind", "")
+        yield f"doc:{kind}:{el.name}:{el.anchor}:{el.signature_name}"
+        if objects:
+            yield from object_tokens(el.obj)
+        for m in getattr(el, "members", ()):
+            yield from _layout_tokens(m, objects)
+    elif isinstance(el, layout.Link):
+        yield f"link:{el.name}"
+        if objects:
+            yield from object_tokens(el.obj)
+    else:
+        yield f"other:{el!r}"
+
+
+def object_tokens(obj: gf.Object | gf.Alias) -> Iterator[str]:
+    """
+    Yield strings that describe the rendered parts of a griffe object
+
+    Only the object itself is described and not its members, but
+    the names of the members are included.
+    """
+    if isinstance(obj, gf.Alias):
+        yield f"alias:{obj.path}:{obj.target_path}"
+        try:
+            obj = obj.final_target
+        except (gf.AliasResolutionError, gf.CyclicAliasError):
+            return
+
+    yield f"object:{obj.kind.value}:{obj.path}:{obj.canonical_path}"
+    yield f"labels:{sorted(obj.labels)}"
+    yield f"docstring:{obj.docstring.value if obj.docstring else None}"
+
+    if isinstance(obj, (gf.Function, gf.Class)):
+        # The parameters of a dataclass include the inherited fields,
+        # whose docstrings are rendered with the class
+        for p in obj.parameters:
+            docstring = p.docstring.value if p.docstring else None
+            yield (
+                f"parameter:{p.name}:{p.kind}:"
+                f"{_expr_token(p.annotation)}:{_expr_token(p.default)}:"
+                f"{docstring}"
+            )
+
+    if isinstance(obj, gf.Function):
+        yield f"returns:{_expr_token(obj.returns)}"
+    elif isinstance(obj, gf.Class):
+        for base in obj.bases:
+            yield f"base:{_expr_token(base)}"
+        for name, attr in obj.attributes.items():
+            yield f"attribute:{name}:{_lines(attr)}"
+    elif isinstance(obj, gf.Attribute):
+        yield f"annotation:{_expr_token(obj.annotation)}"
+        yield f"value:{_expr_token(obj.value)}"
+        yield f"lines:{_lines(obj)}"
+
+    yield f"members:{sorted(obj.members)}"
+
+
+def _expr_token(expr: str | gf.Expr | None) -> str:
+    """
+    Return a string that describes an expression
+
+    The canonical paths of the names in the expression are included
+    because they are the targets of the interlinks.
+    """
+    if not isinstance(expr, gf.Expr):
+        return repr(expr)
+    names = [
+        f"{x.name}={x.canonical_path}"
+        for x in expr.iterate()
+        if isinstance(x, gf.ExprName)
+    ]
+    return f"{expr}|{','.join(names)}"
+
+
+def _lines(obj: gf.Object | gf.Alias) -> str:
+    """
+    Return the source lines of an object
+    """
+    try:
+        return "\n".join(obj.lines)
+    except (gf.AliasResolutionError, gf.CyclicAliasError):
+        return ""
@@ -0,0 +1,287 @@
+"""
+Command line interface
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import sys
+import tempfile
+from contextlib import chdir, contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from typing import Any
+
+    from quartodoc import Builder
+
+    from ._qrenderer import QRenderer
+
+
+def read_config(filepath: Path) -> dict[str, Any]:
+    """
+    Read the quarto configuration file
+
+    Raises
+    ------
+    ValueError
+        If the configuration has no `quartodoc` section.
+    """
+    import yaml
+
+    with filepath.open() as f:
+        config = yaml.safe_load(f) or {}
+
+    if "quartodoc" not in config:
+        raise ValueError(f"No `quartodoc:` section found in {filepath}.")
+    return config
+
+
+def make_renderer(
+    renderer: str | dict[str, Any] | None,
+    options: dict[str, Any],
+) -> QRenderer:
+    """
+    Create the renderer in a `quartodoc.renderer` configuration
+
+    If the style is a python file e.g. `_renderer.py`, it is the
+    `Renderer` class defined in that file. Otherwise it is a QRenderer.
+    The file is imported from the current directory.
+
+    Parameters
+    ----------
+    renderer :
+        The configuration of the renderer
+    options :
+        Options that override the configuration
+
+    Raises
+    ------
+    ValueError
+        If the renderer is not a QRenderer.
+    """
+    from quartodoc.renderers.base import Renderer
+
+    from ._qrenderer import QRenderer
+
+    if renderer is None:
+        renderer = {}
+    elif isinstance(renderer, str):
+        renderer = {"style": renderer}
+
+    config = {**renderer, **options}
+    style = config.pop("style", "")
+    if style.endswith(".py"):
+        obj = Renderer.from_config({"style": style, **config})
+    else:
+        obj = QRenderer(**config)
+
+    if not isinstance(obj, QRenderer):
+        msg = f"The renderer in {style!r} is not a QRenderer."
+        raise ValueError(msg)
+    return obj
+
+
+def make_builder(config: dict[str, Any], options: dict[str, Any]) -> Builder:
+    """
+    Create a builder from the quarto configuration
+
+    Parameters
+    ----------
+    config :
+        The quarto configuration
+    options :
+        Options of the renderer that override the configuration
+    """
+    from quartodoc import Builder
+
+    quartodoc = config["quartodoc"]
+    renderer = make_renderer(quartodoc.get("renderer"), options)
+    return Builder.from_quarto_config(
+        {**config, "quartodoc": {**quartodoc, "renderer": renderer}}
+    )
+
+
+def renderer_options(args: argparse.Namespace) -> dict[str, Any]:
+    """
+    Return the options of the renderer set on the command line
+    """
+    options: dict[str, Any] = {}
+    if args.jobs is not None:
+        options["jobs"] = args.jobs
+    if args.incremental:
+        options["incremental"] = True
+    if args.cache_dir is not None:
+        options["cache_dir"] = str(Path(args.cache_dir).absolute())
+    if args.profile is not None:
+        options["profile"] = str(Path(args.profile).absolute())
+    if args.manifest is not None:
+        options["manifest"] = str(Path(args.manifest).absolute())
+    return options
+
+
+@contextmanager
+def config_directory(filepath: Path) -> Iterator[None]:
+    """
+    Work in the directory of the configuration file
+
+    Paths in the configuration are relative to it, and the modules in it
+    e.g. `_renderer.py` can be imported.
+    """
+    directory = str(filepath.parent)
+    with chdir(directory):
+        sys.path.insert(0, directory)
+        try:
+            yield
+        finally:
+            sys.path.remove(directory)
+
+
+def load_builder(filepath: Path, options: dict[str, Any]) -> Builder:
+    """
+    Create the builder, and exit if the configuration is not valid
+    """
+    try:
+        config = read_config(filepath)
+        return make_builder(config, options)
+    except (FileNotFoundError, ValueError) as err:
+        sys.exit(f"qrenderer: error: {err}")
+
+
+def build(args: argparse.Namespace):
+    """
+    Build the API reference
+    """
+    from ._build import build as build_docs
+
+    filepath = Path(args.config).absolute()
+    with config_directory(filepath):
+        builder = load_builder(filepath, renderer_options(args))
+        build_docs(builder, filter=args.only)
+
+
+def watch(args: argparse.Namespace):
+    """
+    Build the API reference and rebuild it when the sources change
+    """
+    from ._watch import Watcher, restart
+
+    filepath = Path(args.config).absolute()
+    options = {"incremental": True, **renderer_options(args)}
+    cache_dir = None
+    if "cache_dir" not in options:
+        # Without a cache_dir in the configuration, the rendered pages
+        # are kept for as long as the watcher runs
+        cache_dir = tempfile.mkdtemp(prefix="qrenderer-")
+        options["cache_dir"] = cache_dir
+
+    with config_directory(filepath):
+        builder = load_builder(filepath, options)
+        try:
+            changed = Watcher(builder, filepath, args.only).watch(
+                args.interval
+            )
+        finally:
+            if cache_dir:
+                shutil.rmtree(cache_dir, ignore_errors=True)
+
+    if changed:
+        restart()
+
+
+def add_build_arguments(parser: argparse.ArgumentParser):
+    """
+    Add the arguments that control how the pages are built
+    """
+    _ = parser.add_argument(
+        "--config",
+        default="_quarto.yml",
+        help="The quarto configuration file. Default: %(default)s",
+    )
+    _ = parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        metavar="N",
+        help=(
+            "Number of processes used to render the pages. "
+            "Use 0 for as many as there are cpus."
+        ),
+    )
+    _ = parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only render the pages whose objects have changed.",
+    )
+    _ = parser.add_argument(
+        "--cache-dir",
+        metavar="DIR",
+        help="Directory in which to cache the rendered pages.",
+    )
+    _ = parser.add_argument(
+        "--only",
+        default="*",
+        metavar="GLOB",
+        help="Only render & write the pages whose paths match GLOB.",
+    )
+    _ = parser.add_argument(
+        "--profile",
+        metavar="FILE",
+        help="Time the phases of rendering and write the report to FILE.",
+    )
+    _ = parser.add_argument(
+        "--manifest",
+        metavar="FILE",
+        help=(
+            "Write a json manifest of the files, their objects, digests "
+            "and render times, and the files that have changed to FILE."
+        ),
+    )
+
+
+def main(argv: Sequence[str] | None = None):
+    """
+    Run the command line interface
+    """
+    parser = argparse.ArgumentParser(
+        prog="qrenderer",
+        description="Build API documentation with quartodoc and qrenderer",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    build_parser = commands.add_parser(
+        "build",
+        help="Build the API reference",
+        description=(
+            "Read the quartodoc section of the quarto configuration, "
+            "and render and write the pages of the API reference."
+        ),
+    )
+    add_build_arguments(build_parser)
+    build_parser.set_defaults(func=build)
+
+    watch_parser = commands.add_parser(
+        "watch",
+        help="Build the API reference and rebuild it when the sources change",
+        description=(
+            "Build the API reference, then watch the sources of the "
+            "package, the quarto configuration and the renderer. When "
+            "the package changes, only the pages whose objects have "
+            "changed are rendered and written again. When the "
+            "configuration or the renderer changes, start again."
+        ),
+    )
+    add_build_arguments(watch_parser)
+    _ = watch_parser.add_argument(
+        "--interval",
+        type=float,
+        default=1,
+        metavar="SECONDS",
+        help="Time between checks for changes. Default: %(default)s",
+    )
+    watch_parser.set_defaults(func=watch)
+
+    args = parser.parse_args(argv)
+    args.func(args)
@@ -0,0 +1,185 @@
+"""
+Tracking the objects that rendered pages depend on
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, TypedDict
+
+import griffe as gf
+from quartodoc import layout
+
+from ._cache import hash_tokens, object_tokens, page_key
+from ._utils import write_atomic
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+    from typing import Any
+
+
+class PageRecord(TypedDict):
+    """
+    What a rendered page depends on
+    """
+
+    structure: str
+    """Key of the layout of the page"""
+
+    dependencies: dict[str, str | None]
+    """
+    Digest of every object the page touched, by canonical path
+
+    The digest is None for objects that are not part of the documented
+    packages e.g `int` or `typing.Optional`.
+    """
+
+    key: str
+    """Key of the rendered content in the page cache"""
+
+
+@dataclass
+class DependencyGraph:
+    """
+    The objects that each page depends on
+
+    The graph is kept between builds. In the next build, a page only
+    needs to be rendered again if its layout has changed or any of the
+    objects it touched has changed.
+    """
+
+    filepath: Path
+    """File in which the graph is stored"""
+
+    salt: str
+    """Fingerprint of the renderer that created the graph"""
+
+    pages: dict[str, PageRecord] = field(default_factory=dict)
+    """Records of the pages by page path"""
+
+    def __post_init__(self):
+        self._digests: dict[tuple[int, str], str | None] = {}
+        """Digests of objects computed in this build"""
+
+    @classmethod
+    def load(cls, filepath: Path, salt: str) -> DependencyGraph:
+        """
+        Load the graph stored in a file
+
+        If the file does not exist or the graph was created by a renderer
+        with a different fingerprint, the graph is empty.
+        """
+        data: dict[str, Any]
+        try:
+            data = json.loads(filepath.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            data = {}
+
+        pages: dict[str, PageRecord] = (
+            data["pages"] if data.get("salt") == salt else {}
+        )
+        return cls(filepath, salt, pages)
+
+    def save(self):
+        """
+        Store the graph in its file
+        """
+        data = {"salt": self.salt, "pages": self.pages}
+        write_atomic(self.filepath, json.dumps(data, indent=1).encode("utf-8"))
+
+    def clear_digests(self):
+        """
+        Forget the digests of the objects
+
+        This should be called when the objects may have changed in the
+        same process.
+        """
+        self._digests.clear()
+
+    def digest(
+        self, collection: gf.ModulesCollection, path: str
+    ) -> str | None:
+        """
+        Return the digest of the object at path
+
+        Parameters
+        ----------
+        collection :
+            The modules in which to lookup the object
+        path :
+            Path to the object
+        """
+        key = (id(collection), path)
+        try:
+            return self._digests[key]
+        except KeyError:
+            pass
+
+        try:
+            obj = collection[path]
+        except (KeyError, gf.AliasResolutionError, gf.CyclicAliasError):
+            digest = None
+        else:
+            digest = hash_tokens(object_tokens(obj))
+
+        self._digests[key] = digest
+        return digest
+
+    def lookup(self, page: layout.Page) -> str | None:
+        """
+        Return the cache key of the page if nothing it depends on changed
+        """
+        record = self.pages.get(page.path)
+        if record is None or record["structure"] != page_key(
+            page, self.salt, objects=False
+        ):
+            return None
+
+        collection = page_collection(page)
+        for path, digest in record["dependencies"].items():
+            if self.digest(collection, path) != digest:
+                return None
+        return record["key"]
+
+    def update(self, page: layout.Page, paths: Iterable[str]) -> str:
+        """
+        Record the objects that a page depends on
+
+        Parameters
+        ----------
+        page :
+            The page that has been rendered
+        paths :
+            Canonical paths of the objects touched when rendering the page
+
+        Returns
+        -------
+        :
+            Key with which to store the rendered page in the cache.
+        """
+        collection = page_collection(page)
+        structure = page_key(page, self.salt, objects=False)
+        dependencies = {p: self.digest(collection, p) for p in sorted(paths)}
+        key = hash_tokens(
+            (f"{p}:{d}" for p, d in dependencies.items()), structure
+        )
+        self.pages[page.path] = {
+            "structure": structure,
+            "dependencies": dependencies,
+            "key": key,
+        }
+        return key
+
+
+def page_collection(page: layout.Page) -> gf.ModulesCollection:
+    """
+    Return the collection of modules from which the page was created
+    """
+    for el in page.contents:
+        if isinstance(el, (layout.Doc, layout.Link)):
+            return el.obj.modules_collection
+        elif isinstance(el, layout.Page):
+            return page_collection(el)
+    return gf.ModulesCollection()
@@ -0,0 +1,166 @@
+"""
+Lookup of the objects excluded from the documentation
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+from fnmatch import translate
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from typing import TypeAlias
+
+    Pattern: TypeAlias = str | re.Pattern[str]
+    """A name, a glob pattern or a compiled regular expression"""
+
+
+# Characters that make a string a glob pattern
+GLOB_CHARS = frozenset("*?[")
+
+
+@dataclass(frozen=True)
+class Excluded:
+    """
+    The names excluded from an object
+    """
+
+    names: frozenset[str] = frozenset()
+    """Names excluded by their exact value"""
+
+    pattern: re.Pattern[str] | None = None
+    """Names excluded by a glob pattern or a regular expression"""
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.names or (
+            self.pattern is not None
+            and self.pattern.fullmatch(name) is not None
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.names) or self.pattern is not None
+
+
+NOTHING_EXCLUDED = Excluded()
+
+
+def _compile(pattern: Pattern) -> re.Pattern[str] | None:
+    """
+    Return the regular expression of a pattern or None if it is a name
+    """
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    elif GLOB_CHARS.intersection(pattern):
+        return re.compile(translate(pattern))
+    return None
+
+
+def _make_excluded(values: list[Pattern]) -> Excluded:
+    """
+    Create the Excluded names from a list of names and patterns
+    """
+    names: set[str] = set()
+    regexes: list[str] = []
+    for value in values:
+        if (regex := _compile(value)) is None:
+            names.add(str(value))
+        else:
+            regexes.append(f"(?:{regex.pattern})")
+
+    pattern = re.compile("|".join(regexes)) if regexes else None
+    return Excluded(frozenset(names), pattern)
+
+
+class Exclusions(MutableMapping["Pattern", "Pattern | Sequence[Pattern]"]):
+    """
+    The names excluded from objects, indexed for fast lookups
+
+    This is a mapping from an object path to the name(s) to exclude from
+    it. The paths and the names can be glob patterns, e.g. `pkg.*` and
+    `deprecated_*`, or compiled regular expressions. The specification is
+    compiled when it is first looked up after a change, and the names
+    excluded from each path are worked out once.
+    """
+
+    def __init__(self):
+        self._spec: dict[Pattern, Pattern | Sequence[Pattern]] = {}
+        self._index: _Index | None = None
+
+    def __getitem__(self, key: Pattern) -> Pattern | Sequence[Pattern]:
+        return self._spec[key]
+
+    def __setitem__(self, key: Pattern, value: Pattern | Sequence[Pattern]):
+        self._spec[key] = value
+        self._index = None
+
+    def __delitem__(self, key: Pattern):
+        del self._spec[key]
+        self._index = None
+
+    def __iter__(self) -> Iterator[Pattern]:
+        return iter(self._spec)
+
+    def __len__(self) -> int:
+        return len(self._spec)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._spec!r})"
+
+    def lookup(self, path: str) -> Excluded:
+        """
+        Return the names excluded from the object at path
+
+        Parameters
+        ----------
+        path :
+            The path of the object as shown on the API page.
+        """
+        if self._index is None:
+            self._index = _Index(self._spec)
+        return self._index.lookup(path)
+
+
+class _Index:
+    """
+    Compiled specification of the excluded names
+    """
+
+    def __init__(self, spec: dict[Pattern, Pattern | Sequence[Pattern]]):
+        self.literal: dict[str, list[Pattern]] = {}
+        """Excluded names of the paths that are not patterns"""
+
+        self.patterns: list[tuple[re.Pattern[str], list[Pattern]]] = []
+        """Path patterns and the names they exclude"""
+
+        self.cache: dict[str, Excluded] = {}
+        """Excluded names of the paths that have been looked up"""
+
+        for key, value in spec.items():
+            values = (
+                [value] if isinstance(value, (str, re.Pattern)) else [*value]
+            )
+            if (regex := _compile(key)) is None:
+                self.literal.setdefault(str(key), []).extend(values)
+            else:
+                self.patterns.append((regex, values))
+
+    def lookup(self, path: str) -> Excluded:
+        """
+        Return the names excluded from the object at path
+        """
+        try:
+            return self.cache[path]
+        except KeyError:
+            pass
+
+        values = [*self.literal.get(path, ())]
+        for regex, names in self.patterns:
+            if regex.fullmatch(path):
+                values.extend(names)
+
+        excluded = _make_excluded(values) if values else NOTHING_EXCLUDED
+        self.cache[path] = excluded
+        return excluded
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import re
-from functools import partial, singledispatch
+from functools import lru_cache, partial, singledispatch
 from textwrap import dedent
 from typing import TYPE_CHECKING, cast
 
@@ -18,17 +18,26 @@ if TYPE_CHECKING:
 IDENTIFIER_RE = re.compile(r"\b(?P<identifier>[^\W\d]\w*)", flags=re.UNICODE)
 
 # Pickout quoted strings from a string of code
+# Within quotes, match runs of characters that are not a quote or
+# backslash, separated by characters that have been backslashed
+_double_quoted = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+_single_quoted = r"'[^'\\]*(?:\\.[^'\\]*)*'"
 STRING_RE = re.compile(
-    r"(?P<string>"  # group
-    # Within quotes, match any character that has been backslashed
-    # or that is not a double quote or backslash
-    r'"(?:\\.|[^"\\])*"'  # double-quoted
-    r"|"  # or
-    r"'(?:\\.|[^'\\])*'"  # single-queoted
-    ")",
+    rf"(?P<string>{_double_quoted}|{_single_quoted})",
     flags=re.UNICODE,
 )
 
+# Pickout the parts of code that pretty_code changes: quoted strings,
+# indents, newlines and any unpaired quotes
+PRETTY_CODE_RE = re.compile(
+    rf"(?P<string>{_double_quoted}|{_single_quoted})"
+    r"|(?P<other> {4}|\n|[\"'])",
+    flags=re.UNICODE,
+)
+
+# Number of inputs whose pretty_code is remembered
+PRETTY_CODE_CACHE_SIZE = 4096
+
 # Pickout qualified path names at the beginning of every line
 _qualname = r"[a-zA-Z_][a-zA-Z0-9_]*(?:\.[a-zA-Z_][a-zA-Z0-9_]*)*"
 QUALNAME_RE = re.compile(
@@ -42,6 +51,14 @@ SEE_ALSO_MULTILINEITEM_RE = re.compile(r"\n +")
 # This translation table maps the quotes to html escape sequences
 QUOTES_TRANSLATION = str.maketrans({'"': "&quot;", "'": "&apos;"})
 
+# What pretty_code replaces outside quoted strings
+PRETTY_CODE_REPLACEMENTS = {
+    " " * 4: "&nbsp;" * 4,
+    "\n": "<br>",
+    '"': "&quot;",
+    "'": "&apos;",
+}
+
 # Characters that can appear that the start of a markedup string
 MARKDOWN_START_CHARS = {"_", "*"}
 
@@ -180,6 +197,7 @@ def formatted_signature(name: str, params: list[str]) -> str:
     return sig
 
 
+@lru_cache(maxsize=PRETTY_CODE_CACHE_SIZE)
 def pretty_code(s: str) -> str:
     """
     Make code that will not be highlighted by pandoc pretty
@@ -196,7 +214,24 @@ def pretty_code(s: str) -> str:
         the links, but should not be wrapped inside the <code>
         tags. Those tags should wrap the output of this function.
     """
-    return escape_quotes(escape_indents(highlight_strings(dedent(s))))
+    # This is equivalent to
+    #     escape_quotes(escape_indents(highlight_strings(dedent(s))))
+    # but it scans the code once
+    if s[:1] in " \t" or "\n" in s:
+        s = dedent(s)
+    return PRETTY_CODE_RE.sub(_pretty_code_match, s)
+
+
+def _pretty_code_match(m: re.Match[str]) -> str:
+    """
+    Return the pretty version of a part of code matched by PRETTY_CODE_RE
+    """
+    string_str = m.group("string")
+    if string_str is None:
+        return PRETTY_CODE_REPLACEMENTS[m.group("other")]
+    # A Span for the string (as created by highlight_strings) with the
+    # indents, newlines and quotes in it escaped
+    return f"[{escape_quotes(escape_indents(string_str))}]{{.st}}"
 
 
 def interlink_groups(m: re.Match[str], lookup: dict[str, str]) -> str:
@@ -1,33 +1,29 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from ._exclude import Exclusions
 
-if TYPE_CHECKING:
-    from collections.abc import Sequence
-
-
-EXCLUDE_PARAMETERS: dict[str, str | Sequence[str]] = {}
+EXCLUDE_PARAMETERS = Exclusions()
 """
 The parameters of callables to exclude from the documentation.
 
 The specification is {callable_object_path: parameter_name | parameter_names}.
 """
 
-EXCLUDE_ATTRIBUTES: dict[str, str | Sequence[str]] = {}
+EXCLUDE_ATTRIBUTES = Exclusions()
 """
 The attributes to exclude from the documentation.
 
 The specification is {parent_object_path: attribute_name | attribute_names}.
 """
 
-EXCLUDE_FUNCTIONS: dict[str, str | Sequence[str]] = {}
+EXCLUDE_FUNCTIONS = Exclusions()
 """
 The functions to exclude from the documentation.
 
 The specification is {parent_object_path: class_name | function_names}.
 """
 
-EXCLUDE_CLASSES: dict[str, str | Sequence[str]] = {}
+EXCLUDE_CLASSES = Exclusions()
 """
 The classes to exclude from the documentation.
 
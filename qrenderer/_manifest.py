@@ -0,0 +1,136 @@
+"""
+The manifest of the files written by a build
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, TypedDict
+
+from ._utils import write_if_changed
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+class FileRecord(TypedDict):
+    """
+    What went into a file of the documentation
+    """
+
+    objects: list[str]
+    """
+    Canonical paths of the objects touched when rendering the file
+
+    These are the documented objects and the objects they link to.
+    """
+
+    digest: str
+    """sha256 of the content of the file"""
+
+    size: int
+    """Size of the file in bytes"""
+
+    render_time: float | None
+    """
+    Seconds it took to render the file
+
+    It is None if the file was not rendered in the build that last
+    wrote it e.g. it came from the cache.
+    """
+
+
+@dataclass
+class RenderedFile:
+    """
+    A file rendered in the current build
+    """
+
+    objects: set[str] | None = None
+    """
+    Canonical paths of the objects touched when rendering the file
+
+    None if they are not known e.g. the content came from the cache and
+    the build is not incremental. The objects are then carried over from
+    the previous manifest.
+    """
+
+    render_time: float | None = None
+    """Seconds it took to render the file"""
+
+
+def load_files(filepath: Path) -> dict[str, FileRecord]:
+    """
+    Load the records of the files in a manifest
+
+    If the manifest does not exist or cannot be read, there are no files.
+    """
+    data: dict[str, Any]
+    try:
+        data = json.loads(filepath.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        data = {}
+    return data.get("files", {})
+
+
+def write_manifest(filepath: Path, rendered: dict[Path, RenderedFile]):
+    """
+    Write the manifest of the files of the documentation
+
+    The manifest is a json file with three keys:
+
+    - `files` - The [](`~qrenderer._manifest.FileRecord`) of each file,
+      by path.
+    - `changed` - The files that are new or whose content has changed
+      since the previous manifest.
+    - `removed` - The files in the previous manifest that no longer
+      exist.
+
+    The files that were not rendered in this build e.g. the pages
+    filtered out, keep their records from the previous manifest.
+
+    Parameters
+    ----------
+    filepath :
+        File to which the manifest is written
+    rendered :
+        Files rendered in this build, by path
+    """
+    previous = load_files(filepath)
+    rendered_names = {path.as_posix() for path in rendered}
+    files = {
+        name: record
+        for name, record in previous.items()
+        if name not in rendered_names and Path(name).exists()
+    }
+    for path, info in rendered.items():
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            continue
+
+        name = path.as_posix()
+        objects = info.objects
+        if objects is None:
+            objects = previous[name]["objects"] if name in previous else []
+        files[name] = {
+            "objects": sorted(objects),
+            "digest": hashlib.sha256(content).hexdigest(),
+            "size": len(content),
+            "render_time": info.render_time,
+        }
+
+    data = {
+        "files": dict(sorted(files.items())),
+        "changed": sorted(
+            name
+            for name, record in files.items()
+            if name not in previous
+            or previous[name]["digest"] != record["digest"]
+        ),
+        "removed": sorted(previous.keys() - files.keys()),
+    }
+    _ = write_if_changed(filepath, json.dumps(data, indent=1))
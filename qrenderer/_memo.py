@@ -0,0 +1,226 @@
+"""
+Memoizing rendered fragments that repeat across objects
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, cast
+
+import griffe as gf
+from quartodoc import ast as qast
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from quartodoc.pandoc.blocks import Block
+
+    from ._pandoc.inlines import InterLink
+    from .typing import Annotation
+
+
+AnnotationKey = tuple[str, tuple[tuple[str, str], ...] | None]
+SectionsKey = tuple[type, int, int, "Hashable"]
+RenderedSections = tuple[list["Block"], list[str], tuple[str, ...]]
+MemberKey = tuple[type, str, int]
+
+
+@dataclass
+class AnnotationCache:
+    """
+    Rendered annotations shared by all the objects of a renderer
+
+    Annotations like `str | None` appear in the signatures of many
+    objects, and they render the same wherever they appear if the names
+    in them refer to the same objects.
+    """
+
+    entries: dict[AnnotationKey, tuple[str | InterLink, tuple[str, ...]]] = (
+        field(default_factory=dict)
+    )
+    """
+    The rendered annotations and the paths of the objects they link to
+    """
+
+    hits: int = 0
+    """Number of annotations that were found in the cache"""
+
+    misses: int = 0
+    """Number of annotations that had to be rendered"""
+
+    def get(
+        self, key: AnnotationKey
+    ) -> tuple[str | InterLink, tuple[str, ...]] | None:
+        """
+        Return the rendered annotation and the paths it depends on
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def set(
+        self,
+        key: AnnotationKey,
+        rendered: str | InterLink,
+        paths: tuple[str, ...],
+    ):
+        """
+        Store a rendered annotation and the paths it depends on
+        """
+        self.entries[key] = (rendered, paths)
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The fraction of the lookups that were hits
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0
+
+
+@dataclass
+class SectionCache:
+    """
+    Docstring sections shared by all the objects of a renderer
+
+    An inherited member has the same docstring in the base class and in
+    every subclass that documents it. The sections of the docstring are
+    transformed once, and they are rendered once for each kind of render
+    object and header level.
+    """
+
+    transformed: dict[int, tuple[gf.Docstring, list[gf.DocstringSection]]] = (
+        field(default_factory=dict)
+    )
+    """
+    The transformed sections of the docstrings
+
+    The key is the id of the docstring, which is kept alive by the entry
+    so that the id is not reused.
+    """
+
+    entries: dict[SectionsKey, tuple[gf.Docstring, RenderedSections]] = field(
+        default_factory=dict
+    )
+    """
+    The rendered sections, their kinds and the paths they depend on
+    """
+
+    hits: int = 0
+    """Number of rendered sections that were found in the cache"""
+
+    misses: int = 0
+    """Number of rendered sections that had to be rendered"""
+
+    def transform(self, docstring: gf.Docstring) -> list[gf.DocstringSection]:
+        """
+        Return the transformed sections of a docstring
+        """
+        entry = self.transformed.get(id(docstring))
+        if entry is None:
+            sections = cast(
+                "list[gf.DocstringSection]", qast.transform(docstring.parsed)
+            )
+            entry = self.transformed[id(docstring)] = (docstring, sections)
+        return entry[1]
+
+    def get(self, key: SectionsKey) -> RenderedSections | None:
+        """
+        Return the rendered sections, their kinds and dependencies
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1]
+
+    def set(
+        self,
+        key: SectionsKey,
+        docstring: gf.Docstring,
+        rendered: RenderedSections,
+    ):
+        """
+        Store the rendered sections of a docstring
+        """
+        self.entries[key] = (docstring, rendered)
+
+
+@dataclass
+class MemberCache:
+    """
+    Documentation of class members shared by all the classes of a renderer
+
+    An inherited method or attribute is documented the same way in every
+    subclass except for the identifier of the header, which is the path
+    of the member in each subclass.
+    """
+
+    entries: dict[MemberKey, tuple[str, str, tuple[str, ...]]] = field(
+        default_factory=dict
+    )
+    """
+    The rendered members, the paths they were rendered for and the paths
+    of the objects they depend on
+    """
+
+    hits: int = 0
+    """Number of members that were found in the cache"""
+
+    misses: int = 0
+    """Number of members that had to be rendered"""
+
+    def get(self, key: MemberKey) -> tuple[str, str, tuple[str, ...]] | None:
+        """
+        Return the rendered member, its path and its dependencies
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def set(
+        self,
+        key: MemberKey,
+        rendered: str,
+        path: str,
+        paths: tuple[str, ...],
+    ):
+        """
+        Store a rendered member, its path and its dependencies
+        """
+        self.entries[key] = (rendered, path, paths)
+
+
+def relocate_member(rendered: str, old_path: str, new_path: str) -> str:
+    """
+    Change the path in the header identifier of a rendered member
+    """
+    if old_path == new_path:
+        return rendered
+    return rendered.replace(f"{{#{old_path} ", f"{{#{new_path} ", 1)
+
+
+def annotation_key(annotation: Annotation) -> AnnotationKey:
+    """
+    Return a key that determines how an annotation is rendered
+
+    The key is the text of the annotation and the canonical paths of the
+    names in it, so an annotation that refers to different objects in
+    different modules has different keys. A string annotation has no
+    names.
+    """
+    if isinstance(annotation, str):
+        return annotation, None
+    names = tuple(
+        (x.name, x.canonical_path)
+        for x in annotation.iterate(flat=True)
+        if isinstance(x, gf.ExprName)
+    )
+    return str(annotation), names
@@ -1,42 +1,151 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-import yaml
 from quartodoc.pandoc.blocks import (
     Block,
     BlockContent,
     Blocks,
+    Div,
     Header,
-    blockcontent_to_str,
 )
+from quartodoc.pandoc.inlines import Inline
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
     from typing import Any
 
+    from _typeshed import SupportsWrite
     from quartodoc.pandoc.components import Attr
     from quartodoc.pandoc.inlines import Code
 
 
+class StreamingBlock(Block):
+    """
+    A block that can be written out as a stream of markdown fragments
+
+    Subclasses implement `iter_chunks`. Converting a block to a string
+    joins the fragments once, and nested streaming blocks pass their
+    fragments along without creating intermediate strings.
+    """
+
+    def iter_chunks(self) -> Iterator[str]:
+        """
+        Yield the markdown of the block in fragments
+        """
+        raise NotImplementedError(
+            f"iter_chunks method not implemented for: {type(self)}"
+        )
+
+    def write_to(self, stream: SupportsWrite[str]):
+        """
+        Write the markdown of the block to a stream
+
+        Parameters
+        ----------
+        stream :
+            File-like object with a `write` method.
+        """
+        for chunk in self.iter_chunks():
+            _ = stream.write(chunk)
+
+    def __str__(self):
+        return "".join(self.iter_chunks())
+
+
+def iter_block_chunks(block: Block) -> Iterator[str]:
+    """
+    Yield the fragments that make up `str(block)`
+    """
+    # A subclass that overrides __str__ (e.g. a user extension of a
+    # Render class) decides its own output, so we have to respect it.
+    if (
+        isinstance(block, StreamingBlock)
+        and type(block).__str__ is StreamingBlock.__str__
+    ):
+        yield from block.iter_chunks()
+    elif type(block) is Blocks:
+        if block.elements:
+            yield from iter_join_block_content(block.elements)
+    elif type(block) is Div:
+        attr = block.attr or ""
+        yield f"::: {{{attr}}}\n"
+        yield from iter_blockcontent_chunks(block.content)
+        yield "\n:::"
+    else:
+        yield str(block)
+
+
+def iter_join_block_content(content: Sequence[BlockContent]) -> Iterator[str]:
+    """
+    Yield the fragments that make up `join_block_content(content)`
+    """
+    sep = ""
+    for c in content:
+        if not c:
+            continue
+        yield sep
+        yield from iter_blockcontent_chunks(c)
+        sep = "\n\n"
+
+
+def iter_blockcontent_chunks(content: BlockContent | None) -> Iterator[str]:
+    """
+    Yield the fragments that make up `blockcontent_to_str(content)`
+    """
+    if not content:
+        return
+    elif isinstance(content, (str, Inline)):
+        yield str(content).rstrip("\n")
+    elif isinstance(content, Block):
+        yield from _rstrip_newlines(iter_block_chunks(content))
+    elif isinstance(content, Sequence):  # pyright: ignore[reportUnnecessaryIsInstance]
+        yield from iter_join_block_content(content)
+    else:
+        raise TypeError(f"Could not process type: {type(content)}")
+
+
+def _rstrip_newlines(chunks: Iterable[str]) -> Iterator[str]:
+    """
+    Yield the chunks without the trailing newlines of the whole stream
+    """
+    # Newlines at the end of a chunk are held back until we know
+    # that they are not at the end of the stream
+    pending = ""
+    for chunk in chunks:
+        stripped = chunk.rstrip("\n")
+        if stripped:
+            yield pending
+            yield stripped
+            pending = chunk[len(stripped) :]
+        else:
+            pending += chunk
+
+
 @dataclass
-class Meta(Block):
+class Meta(StreamingBlock):
     """
     Pandoc meta data block
     """
 
     table: dict[str, Any]
 
-    def __str__(self):
+    def iter_chunks(self) -> Iterator[str]:
+        import yaml
+
         yml = yaml.dump(self.table, allow_unicode=True, sort_keys=False)
-        return f"---\n{yml}---"
+        yield f"---\n{yml}---"
 
 
-RawHTMLBlockTag_TPL = """\
+RawHTMLBlockTag_OPEN_TPL = """\
 ```{{=html}}
 <{tag}{attr}>
 ```
-{content}
+"""
+
+RawHTMLBlockTag_CLOSE_TPL = """
 ```{{=html}}
 </{tag}>
 ```
@@ -44,7 +153,7 @@ RawHTMLBlockTag_TPL = """\
 
 
 @dataclass
-class RawHTMLBlockTag(Block):
+class RawHTMLBlockTag(StreamingBlock):
     """
     A Raw HTML Block Tag
 
@@ -56,19 +165,18 @@ class RawHTMLBlockTag(Block):
     content: BlockContent | None = None
     attr: Attr | None = None
 
-    def __str__(self):
+    def iter_chunks(self) -> Iterator[str]:
         """
-        Return tag content as markdown
+        Yield tag content as markdown
         """
-        content = blockcontent_to_str(self.content)
         attr = (self.attr and f" {self.attr.html}") or ""
-        return RawHTMLBlockTag_TPL.format(
-            tag=self.tag, content=content, attr=attr
-        )
+        yield RawHTMLBlockTag_OPEN_TPL.format(tag=self.tag, attr=attr)
+        yield from iter_blockcontent_chunks(self.content)
+        yield RawHTMLBlockTag_CLOSE_TPL.format(tag=self.tag)
 
 
 @dataclass
-class RenderedDocObject(Block):
+class RenderedDocObject(StreamingBlock):
     """
     The rendered parts of an object
     """
@@ -77,6 +185,7 @@ class RenderedDocObject(Block):
     signature: Code | str | None = None
     body: BlockContent | None = None
 
-    def __str__(self):
-        lst = [b for b in (self.title, self.signature, self.body) if b]
-        return str(Blocks(lst))
+    def iter_chunks(self) -> Iterator[str]:
+        yield from iter_join_block_content(
+            [self.title, self.signature, self.body]
+        )
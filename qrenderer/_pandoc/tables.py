@@ -0,0 +1,117 @@
+"""
+Pandoc tables
+"""
+
+from __future__ import annotations
+
+import unicodedata
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Headers are wider than the widest cell under them by at least this
+MIN_HEADER_PADDING = 2
+
+
+def text_width(s: str) -> int:
+    """
+    Return the number of columns that a string takes up in monospace
+
+    East Asian wide characters take up two columns and combining
+    characters take up none.
+    """
+    if s.isascii():
+        return len(s)
+    return sum(
+        0
+        if unicodedata.combining(c)
+        else 2
+        if unicodedata.east_asian_width(c) in "WF"
+        else 1
+        for c in s
+    )
+
+
+def grid_table(
+    rows: Sequence[Sequence[object]],
+    headers: Sequence[str] | None = None,
+) -> str:
+    """
+    Create a pandoc grid table
+
+    The cells are written as text (None is an empty cell) aligned to the
+    left, and a cell with newlines spans multiple lines. The table is the
+    same as the one created by `tabulate(rows, headers, "grid")` for
+    cells that do not look like numbers.
+
+    Parameters
+    ----------
+    rows :
+        The rows of the table
+    headers :
+        The headers of the columns
+    """
+    if not rows and not headers:
+        return ""
+
+    cells = [
+        ["" if c is None else str(c).strip() for c in row] for row in rows
+    ]
+    ncols = len(headers) if headers else len(cells[0])
+
+    # The width of a column is that of the widest line in any of its cells
+    widths = (
+        [text_width(h) + MIN_HEADER_PADDING for h in headers]
+        if headers
+        else [0] * ncols
+    )
+    multiline = False
+    for row in cells:
+        for j, cell in enumerate(row):
+            if "\n" in cell or "\r" in cell:
+                multiline = True
+                w = max(text_width(line) for line in cell.splitlines())
+            else:
+                w = text_width(cell)
+            if w > widths[j]:
+                widths[j] = w
+
+    def make_line(fill: str) -> str:
+        return "+" + "+".join(fill * (w + 2) for w in widths) + "+"
+
+    def make_row(row: Sequence[str]) -> str:
+        return (
+            "| "
+            + " | ".join(
+                c + " " * (w - text_width(c)) for c, w in zip(row, widths)
+            )
+            + " |"
+        )
+
+    def make_multiline_row(row: Sequence[str]) -> list[str]:
+        cell_lines = [c.splitlines() or [""] for c in row]
+        nlines = max(len(lines) for lines in cell_lines)
+        return [
+            make_row(
+                [lines[i] if i < len(lines) else "" for lines in cell_lines]
+            )
+            for i in range(nlines)
+        ]
+
+    line = make_line("-")
+    out = [line]
+    if headers:
+        out.append(make_row(headers))
+        out.append(make_line("="))
+        if not cells:
+            out.append(line)
+
+    for row in cells:
+        if multiline:
+            out.extend(make_multiline_row(row))
+        else:
+            out.append(make_row(row))
+        out.append(line)
+
+    return "\n".join(out)
@@ -0,0 +1,248 @@
+"""
+Rendering in parallel
+"""
+
+from __future__ import annotations
+
+import importlib
+import multiprocessing
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
+
+from ._profile import PhaseTimings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from typing import Any, TypeVar
+
+    import griffe as gf
+    from quartodoc import layout
+
+    from ._qrenderer import QRenderer
+    from .typing_information import TypeInformation
+
+    T = TypeVar("T")
+
+
+# The state of a worker process. It is set once when the process starts
+# so that the items and the renderer are not sent along with every task.
+_renderer: QRenderer
+_items: Sequence[Any]
+
+
+def num_jobs(jobs: int) -> int:
+    """
+    Return the number of processes to use for a requested number of jobs
+
+    A number less than 1 means use all the available cpus.
+    """
+    if jobs < 1:
+        jobs = os.cpu_count() or 1
+    return jobs
+
+
+def render_pages_parallel(
+    renderer: QRenderer,
+    pages: Sequence[layout.Page],
+    jobs: int,
+) -> list[tuple[str, set[str], float]]:
+    """
+    Render pages in a pool of processes
+
+    Parameters
+    ----------
+    renderer :
+        The renderer used in the workers
+    pages :
+        Pages to render
+    jobs :
+        Number of worker processes
+
+    Returns
+    -------
+    :
+        The rendered pages, their dependencies and the seconds it took
+        to render them, in the same order as the input pages.
+    """
+    return _map_parallel(renderer, pages, jobs, _render_page)
+
+
+def render_typing_parallel(
+    renderer: QRenderer,
+    infos: Sequence[TypeInformation],
+    jobs: int,
+) -> list[tuple[str, float]]:
+    """
+    Render the typing information of modules in a pool of processes
+
+    Parameters
+    ----------
+    renderer :
+        The renderer used in the workers
+    infos :
+        Typing information to render
+    jobs :
+        Number of worker processes
+
+    Returns
+    -------
+    :
+        The rendered typing information and the seconds it took to
+        render it, in the same order as the input.
+    """
+    return _map_parallel(renderer, infos, jobs, _render_typing)
+
+
+def render_objects_parallel(
+    renderer: QRenderer,
+    objs: Sequence[gf.Object | gf.Alias],
+    jobs: int,
+) -> list[str]:
+    """
+    Render griffe objects in a pool of processes
+
+    Parameters
+    ----------
+    renderer :
+        The renderer used in the workers
+    objs :
+        Objects to render
+    jobs :
+        Number of worker processes
+
+    Returns
+    -------
+    :
+        The rendered objects, in the same order as the input objects.
+    """
+    return _map_parallel(renderer, objs, jobs, _render_object)
+
+
+def _map_parallel(
+    renderer: QRenderer,
+    items: Sequence[Any],
+    jobs: int,
+    func: Callable[[int], tuple[T, PhaseTimings | None]],
+) -> list[T]:
+    """
+    Call func with the index of each item in a pool of processes
+    """
+    # With fork, the workers inherit the items & the renderer, and the
+    # customised Render classes. Otherwise the workers start in a fresh
+    # interpreter, so the payload has to be pickled. It is unpickled after
+    # the module that defines the renderer is imported so that the user
+    # Render classes can be found.
+    if "fork" in multiprocessing.get_all_start_methods():
+        ctx = multiprocessing.get_context("fork")
+        payload = (renderer, items)
+    else:
+        ctx = multiprocessing.get_context()
+        payload = pickle.dumps((renderer, items))
+
+    search_path = [str(Path.cwd()), *sys.path]
+    initargs = (type(renderer).__module__, search_path, payload)
+    chunksize = max(1, len(items) // (jobs * 4))
+    with ctx.Pool(jobs, initializer=_init_worker, initargs=initargs) as pool:
+        results = pool.map(func, range(len(items)), chunksize)
+
+    if renderer.timings is not None:
+        for _, timings in results:
+            if timings is not None:
+                renderer.timings.merge(timings)
+    return [result for result, _ in results]
+
+
+def _init_worker(
+    module: str,
+    search_path: list[str],
+    payload: bytes | tuple[QRenderer, Sequence[Any]],
+):
+    """
+    Prepare a worker process to render
+
+    Parameters
+    ----------
+    module :
+        Name of the module that defines the renderer. This is usually
+        `_renderer`, which also has the customised Render classes.
+    search_path :
+        Where to look for the module. The `_renderer.py` is imported
+        from the current directory.
+    payload :
+        The renderer and all the items to render, possibly pickled.
+    """
+    global _renderer, _items
+
+    sys.path.extend(p for p in search_path if p not in sys.path)
+    # Importing the module (re)defines the user Render classes, and that
+    # extends the base classes in this process.
+    _ = importlib.import_module(module)
+
+    if isinstance(payload, bytes):
+        payload = cast(
+            "tuple[QRenderer, Sequence[Any]]", pickle.loads(payload)
+        )
+    _renderer, _items = payload
+
+
+def _take_timings() -> PhaseTimings | None:
+    """
+    Return the time spent rendering since the last call, if profiling
+    """
+    timings = _renderer.timings
+    if timings is not None:
+        _renderer.timings = PhaseTimings()
+    return timings
+
+
+def _render_page(
+    i: int,
+) -> tuple[tuple[str, set[str], float], PhaseTimings | None]:
+    """
+    Render the i'th page in a worker process
+
+    Returns
+    -------
+    :
+        The rendered page, its dependencies and the seconds it took,
+        and the time spent in each phase if the renderer is profiling.
+    """
+    page = cast("layout.Page", _items[i])
+    rendered = _renderer._render_page_timed(page)  # pyright: ignore[reportPrivateUsage]
+    return rendered, _take_timings()
+
+
+def _render_typing(
+    i: int,
+) -> tuple[tuple[str, float], PhaseTimings | None]:
+    """
+    Render the i'th typing information in a worker process
+
+    Returns
+    -------
+    :
+        The rendered typing information and the seconds it took, and
+        the time spent in each phase if the renderer is profiling.
+    """
+    info = cast("TypeInformation", _items[i])
+    return info.render_timed(), _take_timings()
+
+
+def _render_object(i: int) -> tuple[str, PhaseTimings | None]:
+    """
+    Render the i'th griffe object in a worker process
+
+    Returns
+    -------
+    :
+        The rendered object and the time spent rendering it if the
+        renderer is profiling.
+    """
+    from ._render import get_render_type
+    from ._utils import griffe_to_doc
+
+    doc = griffe_to_doc(_items[i], aliases=False)
+    return str(get_render_type(doc)(doc, _renderer)), _take_timings()
@@ -0,0 +1,171 @@
+"""
+Timing the phases of rendering
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING, Literal
+
+import griffe as gf
+from quartodoc import layout
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from typing import TypeVar
+
+    T = TypeVar("T")
+
+Phase = Literal["title", "signature", "description", "body", "summary"]
+GroupBy = Literal["render_class", "kind", "phase"]
+
+
+@dataclass
+class PhaseStat:
+    """
+    Time spent in a phase of rendering
+    """
+
+    calls: int = 0
+    """Number of times the phase was rendered"""
+
+    total: float = 0
+    """
+    Time in seconds, including the time spent rendering nested objects
+
+    e.g. the body of a class includes its members.
+    """
+
+    own: float = 0
+    """Time in seconds, excluding the time spent rendering nested objects"""
+
+    def add(self, other: PhaseStat):
+        """
+        Add the time of other to this one
+        """
+        self.calls += other.calls
+        self.total += other.total
+        self.own += other.own
+
+
+@dataclass
+class PhaseTimings:
+    """
+    Time spent in each phase of rendering
+
+    The phases are the `title`, `signature`, `description`, `body` and
+    `summary` of the Render classes. They are broken down by the Render
+    class and the kind of object rendered.
+
+    A phase creates the blocks of the documentation, and a phase that
+    uses another phase e.g. the title of a page that uses the title of
+    the object on the page, includes the time of the other phase. Most
+    blocks are converted to text when the page is written, and that time
+    is not part of any phase.
+    """
+
+    stats: defaultdict[tuple[str, str, str], PhaseStat] = field(
+        default_factory=lambda: defaultdict(PhaseStat)
+    )
+    """Times by (render class, object kind, phase)"""
+
+    def __post_init__(self):
+        self._nested: list[float] = []
+        """Time of the nested phases of each phase being timed"""
+
+    def time(
+        self,
+        render_class: str,
+        kind: str,
+        phase: Phase,
+        func: Callable[[], T],
+    ) -> T:
+        """
+        Call func and record the time it takes
+        """
+        self._nested.append(0)
+        start = perf_counter()
+        try:
+            return func()
+        finally:
+            elapsed = perf_counter() - start
+            nested = self._nested.pop()
+            if self._nested:
+                self._nested[-1] += elapsed
+            stat = self.stats[render_class, kind, phase]
+            stat.calls += 1
+            stat.total += elapsed
+            stat.own += elapsed - nested
+
+    def merge(self, other: PhaseTimings):
+        """
+        Add the times recorded in other e.g. by another process
+        """
+        for key, stat in other.stats.items():
+            self.stats[key].add(stat)
+
+    def group(
+        self, by: Sequence[GroupBy] = ("render_class", "kind", "phase")
+    ) -> dict[tuple[str, ...], PhaseStat]:
+        """
+        Return the times aggregated by some of the keys
+
+        Parameters
+        ----------
+        by :
+            The keys to keep. The times are summed over the others.
+        """
+        positions = {"render_class": 0, "kind": 1, "phase": 2}
+        result: defaultdict[tuple[str, ...], PhaseStat] = defaultdict(
+            PhaseStat
+        )
+        for key, stat in self.stats.items():
+            result[tuple(key[positions[b]] for b in by)].add(stat)
+        return dict(result)
+
+    def report(
+        self, by: Sequence[GroupBy] = ("render_class", "kind", "phase")
+    ) -> str:
+        """
+        Return a table of the times, from the most to the least own time
+
+        Parameters
+        ----------
+        by :
+            The keys by which to break down the times.
+        """
+        header = (*by, "calls", "total (s)", "own (s)")
+        rows = [
+            (*key, str(s.calls), f"{s.total:.4f}", f"{s.own:.4f}")
+            for key, s in sorted(
+                self.group(by).items(), key=lambda kv: -kv[1].own
+            )
+        ]
+        widths = [
+            max(len(row[i]) for row in (header, *rows))
+            for i in range(len(header))
+        ]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(w) if i < len(by) else cell.rjust(w)
+                for i, (cell, w) in enumerate(zip(row, widths))
+            )
+            for row in (header, *rows)
+        )
+
+
+def object_kind(layout_obj: object) -> str:
+    """
+    Return the kind of object that a layout object documents
+
+    For layout objects that do not document an object e.g. a Page or
+    a Section, this is the name of the layout type.
+    """
+    if not isinstance(layout_obj, (layout.Doc, layout.Link)):
+        return type(layout_obj).__name__.lower()
+    try:
+        return layout_obj.obj.kind.value
+    except (gf.AliasResolutionError, gf.CyclicAliasError):
+        return "alias"
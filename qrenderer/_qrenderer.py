@@ -1,17 +1,49 @@
 from __future__ import annotations
 
+import sys
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Literal
+from fnmatch import fnmatchcase
+from functools import cached_property
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Literal, cast
 
 from quartodoc.renderers.base import Renderer
 
+from ._cache import PageCache, page_key, renderer_fingerprint
+from ._dependencies import DependencyGraph
+from ._manifest import RenderedFile, write_manifest
+from ._memo import AnnotationCache, MemberCache, SectionCache
+from ._parallel import (
+    num_jobs,
+    render_pages_parallel,
+    render_typing_parallel,
+)
+from ._profile import PhaseTimings
+from ._utils import make_loader, write_if_changed
 from .typing_information import TypeInformation
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+    from typing import TypeVar
+
+    import griffe as gf
     from quartodoc import Builder, layout
 
     from .typing import DisplayNameFormat
 
+    T = TypeVar("T")
+
+
+def _state(factory: Callable[[], T]) -> T:
+    """
+    A field of the renderer that holds state and is not configuration
+    """
+    return field(
+        init=False, repr=False, compare=False, default_factory=factory
+    )
+
 
 @dataclass
 class QRenderer(Renderer):
@@ -33,15 +65,319 @@ class QRenderer(Renderer):
     signature_name_format: DisplayNameFormat = "name"
     typing_module_paths: list[str] = field(default_factory=list)
 
+    cache_dir: str | None = None
+    """
+    Directory in which to cache the rendered pages
+
+    When set, a page whose objects and renderer configuration have
+    not changed since a previous build is not rendered again.
+    """
+
+    jobs: int = 1
+    """
+    Number of processes used to render the pages
+
+    If less than 1, use as many processes as there are cpus. When
+    rendering in parallel, all the pages are rendered before the index
+    page is summarized.
+    """
+
+    incremental: bool = False
+    """
+    Whether to only render the pages whose dependencies have changed
+
+    The objects touched when rendering each page are recorded and
+    stored in the [](`~qrenderer.QRenderer.cache_dir`). In the next
+    build, a page is rendered again only if any of those objects has
+    changed. e.g. editing a base class only renders again the pages of
+    the subclasses that document the inherited members.
+    """
+
+    share_inherited_members: bool = False
+    """
+    Whether to render inherited members once for all the subclasses
+
+    A method or attribute of a class is rendered once, and the rendered
+    documentation is used for every class that inherits it. Only the
+    identifier of the header is changed to match the path of the member
+    in each class. Nested classes and members whose documentation
+    depends on their path, e.g. when the names are displayed in full or
+    when some of their parameters are excluded by path, are rendered for
+    each class.
+    """
+
+    profile: bool | str = False
+    """
+    Whether to time the phases of rendering
+
+    The time spent rendering the title, signature, description, body
+    and summary of the objects is recorded in
+    [](`~qrenderer.QRenderer.timings`), and a report is printed after
+    all the pages have been written. If a string, it is the file to
+    which the report is written instead.
+    """
+
+    manifest: str | None = None
+    """
+    File to which a json manifest of the build is written
+
+    For each file of the API reference, the manifest lists the objects
+    rendered into it, the digest and size of its content and the time it
+    took to render. It also lists the files that have changed since the
+    previous manifest e.g. to render only those with quarto.
+    """
+
     style: str = field(init=False, default="q")
 
+    # The state of the renderer. These fields are set up by the __init__
+    # of the dataclass, so they do not rely on subclasses calling the
+    # __post_init__ of this class.
+
+    _rendered: dict[str, str] = _state(dict)
+    """Pages rendered ahead of the calls to render"""
+
+    _dependencies: set[str] | None = _state(lambda: None)
+    """Objects touched by the page currently being rendered"""
+
+    annotation_cache: AnnotationCache = _state(AnnotationCache)
+    """Annotations rendered so far, shared by all the objects"""
+
+    section_cache: SectionCache = _state(SectionCache)
+    """Docstring sections rendered so far, shared by all the objects"""
+
+    member_cache: MemberCache = _state(MemberCache)
+    """Class members rendered so far, if sharing inherited members"""
+
+    loader: gf.GriffeLoader | None = _state(lambda: None)
+    """
+    Loader of the typing modules
+
+    If None, a new loader is created for each build.
+    """
+
+    _page_files: dict[str, RenderedFile] = _state(dict)
+    """Objects and render time of the pages rendered, by page path"""
+
+    _index_file: RenderedFile = _state(RenderedFile)
+    """Objects and render time of the summary in the index page"""
+
+    page_filter: str = _state(lambda: "*")
+    """
+    Glob pattern of the paths of the pages to render
+
+    The other pages are rendered empty. Set it to the filter passed
+    to the builder, so that the pages it does not write are not
+    rendered.
+    """
+
+    def __post_init__(self):
+        if self.incremental and self.cache_dir is None:
+            raise ValueError("An incremental build requires a cache_dir.")
+
+    @cached_property
+    def timings(self) -> PhaseTimings | None:
+        """
+        Time spent in the phases of rendering, if profiling
+        """
+        return PhaseTimings() if self.profile else None
+
     def render(self, el: layout.Page):
         """
         Render a page
         """
+        if not fnmatchcase(el.path, self.page_filter):
+            return ""
+
+        content = self._rendered.pop(el.path, None)
+        if content is None:
+            content = self.render_pages([el])[0]
+        return content
+
+    def render_pages(self, pages: Sequence[layout.Page]) -> list[str]:
+        """
+        Render pages
+
+        The pages are rendered in parallel if [](`~qrenderer.QRenderer.jobs`)
+        is not 1.
+
+        Parameters
+        ----------
+        pages :
+            Pages to render
+
+        Returns
+        -------
+        :
+            The rendered pages, in the same order as the input pages.
+        """
+        contents = [self._get_cached_page(p) for p in pages]
+        todo = [i for i, c in enumerate(contents) if c is None]
+        jobs = min(num_jobs(self.jobs), len(todo))
+        if jobs > 1:
+            rendered = render_pages_parallel(
+                self, [pages[i] for i in todo], jobs
+            )
+        else:
+            rendered = [self._render_page_timed(pages[i]) for i in todo]
+
+        for i, page in enumerate(pages):
+            if contents[i] is not None:
+                self._page_files[page.path] = RenderedFile(
+                    self._cached_page_dependencies(page)
+                )
+
+        for i, (content, dependencies, seconds) in zip(todo, rendered):
+            contents[i] = content
+            self._cache_page(pages[i], content, dependencies)
+            self._page_files[pages[i].path] = RenderedFile(
+                dependencies, seconds
+            )
+
+        return cast("list[str]", contents)
+
+    def _render_page_timed(
+        self, el: layout.Page
+    ) -> tuple[str, set[str], float]:
+        """
+        Render a page without consulting the cache and time it
+
+        Returns
+        -------
+        :
+            The rendered page, the canonical paths of the objects that
+            were touched when rendering it and the seconds it took.
+        """
+        start = perf_counter()
+        content, dependencies = self._render_page(el)
+        return content, dependencies, perf_counter() - start
+
+    def _render_page(self, el: layout.Page) -> tuple[str, set[str]]:
+        """
+        Render a page without consulting the cache
+
+        Returns
+        -------
+        :
+            The rendered page and the canonical paths of the objects
+            that were touched when rendering it.
+        """
         from . import RenderPage
 
-        return str(RenderPage(el, self, self.header_level))
+        self._dependencies = set()
+        try:
+            content = str(RenderPage(el, self, self.header_level))
+            return content, self._dependencies
+        finally:
+            self._dependencies = None
+
+    def objects_changed(self):
+        """
+        Forget what was worked out from the griffe objects
+
+        Call this method before rendering again in the same process,
+        after the objects have been loaded again. The rendered
+        annotations are kept because they do not depend on the objects.
+        """
+        self.section_cache = SectionCache()
+        self.member_cache = MemberCache()
+        self._rendered.clear()
+        if self._dependency_graph is not None:
+            self._dependency_graph.clear_digests()
+
+    def record_dependency(self, path: str):
+        """
+        Record that the page being rendered depends on an object
+
+        The Render classes call this method for the objects they use.
+        If you extend a Render class to use the information of other
+        objects, call this method with the paths of those objects so
+        that incremental builds render the page when they change.
+
+        Parameters
+        ----------
+        path :
+            Canonical path of the object
+        """
+        if self._dependencies is not None:
+            self._dependencies.add(path)
+
+    @contextmanager
+    def collect_dependencies(self) -> Iterator[set[str]]:
+        """
+        Collect the dependencies recorded within the context
+
+        The dependencies are also recorded for the page being rendered.
+        """
+        outer, self._dependencies = self._dependencies, set()
+        try:
+            yield self._dependencies
+        finally:
+            inner, self._dependencies = self._dependencies, outer
+            if outer is not None:
+                outer.update(inner)
+
+    def _get_cached_page(self, el: layout.Page) -> str | None:
+        """
+        Return the cached content of a page or None if it has to be rendered
+        """
+        if self._page_cache is None:
+            return None
+
+        if self._dependency_graph is not None:
+            key = self._dependency_graph.lookup(el)
+        else:
+            key = page_key(el, self._cache_salt)
+        return self._page_cache.get(key) if key else None
+
+    def _cache_page(
+        self, el: layout.Page, content: str, dependencies: set[str]
+    ):
+        """
+        Store the content of a rendered page in the cache
+        """
+        if self._page_cache is None:
+            return
+
+        if self._dependency_graph is not None:
+            key = self._dependency_graph.update(el, dependencies)
+        else:
+            key = page_key(el, self._cache_salt)
+        self._page_cache.set(key, content)
+
+    def _cached_page_dependencies(self, el: layout.Page) -> set[str] | None:
+        """
+        Return the objects that a cached page depends on, if they are known
+        """
+        if self._dependency_graph is None:
+            return None
+        record = self._dependency_graph.pages.get(el.path)
+        return set(record["dependencies"]) if record else None
+
+    @cached_property
+    def _page_cache(self) -> PageCache | None:
+        """
+        Store for the rendered pages
+        """
+        if self.cache_dir is None:
+            return None
+        return PageCache(Path(self.cache_dir))
+
+    @cached_property
+    def _dependency_graph(self) -> DependencyGraph | None:
+        """
+        The objects that the rendered pages depend on
+        """
+        if not (self.incremental and self.cache_dir):
+            return None
+        filepath = Path(self.cache_dir) / "dependencies.json"
+        return DependencyGraph.load(filepath, self._cache_salt)
+
+    @cached_property
+    def _cache_salt(self) -> str:
+        """
+        Fingerprint of the renderer that is part of every cache key
+        """
+        return renderer_fingerprint(self)
 
     def summarize(self, el: layout.Layout):
         """
@@ -49,16 +385,94 @@ class QRenderer(Renderer):
 
         A Layout consists of a sequence of layout sections and/or layout pages
         """
+        from quartodoc import collect
+
         from . import RenderLayout
 
-        return str(RenderLayout(el, self, self.header_level))
+        if self.jobs != 1:
+            pages, _ = collect(el, base_dir="")
+            pages = [p for p in pages if fnmatchcase(p.path, self.page_filter)]
+            self._rendered = dict(
+                zip([p.path for p in pages], self.render_pages(pages))
+            )
+
+        start = perf_counter()
+        with self.collect_dependencies() as dependencies:
+            content = str(RenderLayout(el, self, self.header_level))
+        self._index_file = RenderedFile(dependencies, perf_counter() - start)
+        return content
 
     def _pages_written(self, builder: Builder):
-        self._write_typing_information(builder)
+        typing_files = self._write_typing_information(builder)
+        if self.manifest:
+            self._write_manifest(builder, typing_files)
+        self._page_files.clear()
+        self._index_file = RenderedFile()
+        if self._dependency_graph is not None:
+            self._dependency_graph.save()
+        if self.timings is not None:
+            report = self.timings.report()
+            if isinstance(self.profile, str):
+                _ = Path(self.profile).write_text(f"{report}\n")
+            else:
+                print(report, file=sys.stderr)
 
-    def _write_typing_information(self, builder: Builder):
+    def _write_manifest(
+        self, builder: Builder, typing_files: dict[Path, RenderedFile]
+    ):
+        """
+        Write the manifest of the files of the API reference
+        """
+        directory = Path(builder.dir)
+        rendered = {
+            directory / builder.out_index: self._index_file,
+            **{
+                directory / f"{path}{builder.out_page_suffix}": info
+                for path, info in self._page_files.items()
+            },
+            **typing_files,
+        }
+        write_manifest(Path(cast("str", self.manifest)), rendered)
+
+    def _write_typing_information(
+        self, builder: Builder
+    ) -> dict[Path, RenderedFile]:
         """
         Render typing information and the interlinks
+
+        All the modules are loaded with one loader. The typing
+        information is rendered in parallel if
+        [](`~qrenderer.QRenderer.jobs`) is not 1, and the files are
+        written after all of it has been rendered. Only the files whose
+        content has changed are written.
+
+        Returns
+        -------
+        :
+            The objects and render time of the files, by path.
         """
-        for module_path in self.typing_module_paths:
-            TypeInformation(module_path, self, builder).write()
+        if not self.typing_module_paths:
+            return {}
+
+        loader = self.loader or make_loader()
+        infos = [
+            TypeInformation(module_path, self, builder, loader)
+            for module_path in self.typing_module_paths
+        ]
+        # Load the objects before any workers are created, so that
+        # they can share the loaded modules
+        for info in infos:
+            builder.items.extend(info.sections.items)
+
+        jobs = min(num_jobs(self.jobs), len(infos))
+        if jobs > 1:
+            rendered = render_typing_parallel(self, infos, jobs)
+        else:
+            rendered = [info.render_timed() for info in infos]
+
+        files: dict[Path, RenderedFile] = {}
+        for info, (content, seconds) in zip(infos, rendered):
+            _ = write_if_changed(info.filepath, content)
+            objects = {item.name for item in info.sections.items}
+            files[info.filepath] = RenderedFile(objects, seconds)
+        return files
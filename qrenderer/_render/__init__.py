@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, overload
 
 from quartodoc.layout import (
+    Doc,
     DocAttribute,
     DocClass,
     DocFunction,
@@ -11,7 +12,10 @@ from quartodoc.layout import (
     Page,
     Section,
 )
+from quartodoc.pandoc.inlines import Link
 
+from .._format import markdown_escape
+from .._utils import describe_object
 from .docattribute import RenderDocAttribute
 from .docclass import RenderDocClass
 from .docfunction import RenderDocFunction
@@ -21,7 +25,10 @@ from .page import RenderPage
 from .section import RenderSection
 
 if TYPE_CHECKING:
-    from qrenderer.typing import Documentable, RenderObjType
+    from collections.abc import Sequence
+
+    from qrenderer import QRenderer
+    from qrenderer.typing import Documentable, RenderObjType, SummaryItem
 
 
 _class_mapping: dict[type[Documentable], type[RenderObjType]] = {
@@ -63,9 +70,71 @@ def get_render_type(obj: Page) -> type[RenderPage]: ...
 def get_render_type(obj: Section) -> type[RenderSection]: ...
 
 
+@overload
+def get_render_type(obj: Documentable) -> type[RenderObjType]: ...
+
+
 def get_render_type(obj: Documentable) -> type[RenderObjType]:
     if type(obj) in _class_mapping:
         return _class_mapping[type(obj)]
     else:
         msg = f"Cannot document object of type {type(obj)}"
         raise ValueError(msg)
+
+
+# The attributes that determine the summary of a Doc object. If none
+# of them has been overridden, we know what the summary will be without
+# creating the render object.
+_summary_attrs = (
+    "__post_init__",
+    "_describe_object",
+    "summary_name",
+    "render_summary",
+)
+
+_default_summary_attrs = {
+    cls: tuple(getattr(cls, name) for name in _summary_attrs)
+    for cls in (
+        RenderDocAttribute,
+        RenderDocClass,
+        RenderDocFunction,
+        RenderDocModule,
+    )
+}
+
+
+def _has_default_summary(cls: type[RenderObjType]) -> bool:
+    """
+    Return True if the summary of the render class has not been extended
+    """
+    default = _default_summary_attrs.get(cls)  # pyright: ignore[reportArgumentType]
+    return default is not None and all(
+        getattr(cls, name) is value
+        for name, value in zip(_summary_attrs, default)
+    )
+
+
+def summarize(obj: Documentable, renderer: QRenderer) -> Sequence[SummaryItem]:
+    """
+    Return the summary line(s) of a documentable object
+
+    This gives the same result as the `render_summary` method of the
+    render object, but for Doc objects whose summary has not been
+    extended, the line is created directly from the layout object.
+    None of the parameters, members and docstring sections of the
+    object are processed.
+
+    Parameters
+    ----------
+    obj :
+        Object to summarize
+    renderer :
+        Renderer that holds the configured values
+    """
+    render_type = get_render_type(obj)
+    if not (isinstance(obj, Doc) and _has_default_summary(render_type)):
+        return render_type(obj, renderer).render_summary()
+
+    renderer.record_dependency(obj.obj.canonical_path)
+    link = Link(markdown_escape(obj.name), f"{obj.name}.qmd#{obj.anchor}")
+    return [(str(link), describe_object(obj.obj))]
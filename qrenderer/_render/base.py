@@ -4,26 +4,28 @@ from dataclasses import dataclass
 from functools import cached_property
 from typing import TYPE_CHECKING
 
-import griffe as gf
-from quartodoc.pandoc.blocks import (
-    Block,
-    BlockContent,
-    Blocks,
-)
-
+from .._pandoc.blocks import StreamingBlock, iter_join_block_content
+from .._profile import object_kind
+from .._utils import describe_object
 from .extending import extend_base_class
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Iterator, Sequence
+    from typing import TypeVar
 
+    import griffe as gf
     from quartodoc import layout
+    from quartodoc.pandoc.blocks import BlockContent
 
     from .. import QRenderer
+    from .._profile import Phase
     from ..typing import SummaryItem
 
+    T = TypeVar("T")
+
 
 @dataclass
-class __RenderBase(Block):
+class __RenderBase(StreamingBlock):
     """
     Render an object
     """
@@ -74,19 +76,17 @@ class __RenderBase(Block):
         Makes it possible for sub-classes to extend the method
         """
 
-    def __str__(self):
+    def iter_chunks(self) -> Iterator[str]:
         """
-        The documentation as quarto markdown
+        The documentation as quarto markdown, in fragments
         """
-        return str(
-            Blocks(
-                [
-                    self.title if self.show_title else None,
-                    self.signature if self.show_signature else None,
-                    self.description if self.show_description else None,
-                    self.body if self.show_body else None,
-                ]
-            )
+        yield from iter_join_block_content(
+            [
+                self.title if self.show_title else None,
+                self.signature if self.show_signature else None,
+                self.description if self.show_description else None,
+                self.body if self.show_body else None,
+            ]
         )
 
     @cached_property
@@ -96,7 +96,7 @@ class __RenderBase(Block):
 
         Do not override this property.
         """
-        return self.render_title()
+        return self._render_phase("title", self.render_title)
 
     @cached_property
     def signature(self) -> BlockContent:
@@ -105,7 +105,7 @@ class __RenderBase(Block):
 
         Do not override this property.
         """
-        return self.render_signature()
+        return self._render_phase("signature", self.render_signature)
 
     @cached_property
     def description(self) -> BlockContent:
@@ -114,7 +114,7 @@ class __RenderBase(Block):
 
         Do not override this property.
         """
-        return self.render_description()
+        return self._render_phase("description", self.render_description)
 
     @cached_property
     def body(self) -> BlockContent:
@@ -123,7 +123,7 @@ class __RenderBase(Block):
 
         Do not override this property.
         """
-        return self.render_body()
+        return self._render_phase("body", self.render_body)
 
     @cached_property
     def summary(self) -> Sequence[SummaryItem]:
@@ -132,21 +132,24 @@ class __RenderBase(Block):
 
         Do not override this property.
         """
-        return self.render_summary()
+        return self._render_phase("summary", self.render_summary)
+
+    def _render_phase(self, phase: Phase, render: Callable[[], T]) -> T:
+        """
+        Render a phase, timing it if the renderer is profiling
+        """
+        timings = self.renderer.timings
+        if timings is None:
+            return render()
+        return timings.time(
+            type(self).__name__, object_kind(self.layout_obj), phase, render
+        )
 
     def _describe_object(self, obj: gf.Object | gf.Alias) -> str:
         """
         Return oneline description of the griffe object
         """
-        # oneline description of the object being documented
-        # This is the first line of the docstring
-        parts = obj.docstring.parsed if obj.docstring else []
-        section = parts[0] if parts else None
-        return (
-            section.value.split("\n")[0]
-            if isinstance(section, gf.DocstringSectionText)
-            else ""
-        )
+        return describe_object(obj)
 
     def render_title(self) -> BlockContent:
         """
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from functools import cached_property, singledispatchmethod
-from typing import TYPE_CHECKING, Literal, cast
+from functools import cached_property
+from typing import TYPE_CHECKING, ClassVar, Literal, cast
 
 import griffe as gf
 from quartodoc import ast as qast
@@ -25,12 +25,13 @@ from .._format import (
     pretty_code,
     repr_obj,
 )
+from .._memo import annotation_key
 from .._pandoc.inlines import InterLink
-from .._utils import is_protocol, is_typealias, is_typevar
+from .._utils import dispatchmethod, is_protocol, is_typealias, is_typevar
 from .base import RenderBase
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Hashable, Sequence
 
     from quartodoc.pandoc.blocks import DefinitionItem
     from quartodoc.pandoc.inlines import InlineContentItem
@@ -97,6 +98,28 @@ class __RenderDoc(RenderBase):
     This is part of the title
     """
 
+    memoize_annotations: ClassVar[bool] = True
+    """
+    Whether to share rendered annotations with other objects
+
+    Annotations are rendered once per renderer and reused wherever they
+    appear. Set this to False in a subclass whose rendering of an
+    annotation depends on more than the annotation itself.
+    """
+
+    memoize_sections: ClassVar[bool] = False
+    """
+    Whether to share rendered docstring sections with other objects
+
+    If True, the sections of a docstring are rendered once per renderer,
+    render class and header level, and reused wherever the docstring
+    appears, e.g. by inherited members. Only set it if the rendering of
+    the sections depends on nothing but the docstring, i.e. no
+    `render_section` method reads `self.obj`, the path or any other
+    state of the object being rendered. Otherwise, the sections rendered
+    for one object are used for another.
+    """
+
     contained: bool = False
     """
     Whether to this object's documentation will be contained within
@@ -142,6 +165,7 @@ class __RenderDoc(RenderBase):
         """Griffe object (or alias)"""
 
         self.show_signature = self.renderer.show_signature
+        self.renderer.record_dependency(self.obj.canonical_path)
 
         if not self.contained:
             self.page_path = f"{self.doc.name}.qmd"
@@ -266,19 +290,43 @@ class __RenderDoc(RenderBase):
 
             annotation = self.obj.annotation
 
-        def _render(ann: Annotation | None) -> str | InterLink:
+        if annotation is None:
+            return ""
+
+        cache = self.renderer.annotation_cache
+        key = annotation_key(annotation) if self.memoize_annotations else None
+        entry = cache.get(key) if key is not None else None
+        if entry is None:
+            linked: list[str] = []
+            entry = self._render_annotation(annotation, linked), tuple(linked)
+            if key is not None:
+                cache.set(key, *entry)
+
+        rendered, paths = entry
+        for path in paths:
+            self.renderer.record_dependency(path)
+        return rendered
+
+    def _render_annotation(
+        self, annotation: Annotation, paths: list[str]
+    ) -> str | InterLink:
+        """
+        Render an annotation, collecting the paths of the linked objects
+        """
+
+        def _render(ann: Annotation) -> str | InterLink:
             # Recursively render annotation
-            if ann is None:
-                return ""
-            elif isinstance(ann, str):
+            if isinstance(ann, str):
                 return repr_obj(ann)
             elif isinstance(ann, gf.ExprName):
+                paths.append(ann.canonical_path)
                 return InterLink(markdown_escape(ann.name), ann.canonical_path)
             else:
                 assert isinstance(ann, gf.Expr)
                 # A type annotation with ~ removes the qualname prefix
                 path_str = ann.canonical_path
                 if path_str[0] == "~":
+                    paths.append(path_str[1:])
                     return InterLink(ann.canonical_name, path_str[1:])
                 return "".join(str(_render(a)) for a in ann)
 
@@ -377,16 +425,45 @@ class __RenderDoc(RenderBase):
         """
         Sections of the docstring
         """
-        sections: list[Block] = []
-        section_kinds: list[str] = []
+        docstring = self.obj.docstring
+        if not docstring:
+            return [], []
+
+        cache = self.renderer.section_cache
+        key = (
+            (type(self), id(docstring), self.level, self._sections_context)
+            if self.memoize_sections
+            else None
+        )
+        entry = cache.get(key) if key is not None else None
+        if entry is None:
+            with self.renderer.collect_dependencies() as paths:
+                sections, section_kinds = self._render_sections(docstring)
+            entry = sections, section_kinds, tuple(paths)
+            if key is not None:
+                cache.set(key, docstring, entry)
+
+        sections, section_kinds, paths = entry
+        for path in paths:
+            self.renderer.record_dependency(path)
+        return list(sections), list(section_kinds)
 
-        if not self.obj.docstring:
-            return sections, section_kinds
+    @property
+    def _sections_context(self) -> Hashable:
+        """
+        Information other than the docstring that the sections depend on
+        """
+        return None
 
-        patched_sections = cast(
-            "list[gf.DocstringSection]",
-            qast.transform(self.obj.docstring.parsed),
-        )
+    def _render_sections(
+        self, docstring: gf.Docstring
+    ) -> tuple[list[Block], list[str]]:
+        """
+        Render the sections of a docstring
+        """
+        sections: list[Block] = []
+        section_kinds: list[str] = []
+        patched_sections = self.renderer.section_cache.transform(docstring)
         for section in patched_sections:
             title = (section.title or section.kind.value).title()
             body = self.render_section(section) or ""
@@ -416,7 +493,7 @@ class __RenderDoc(RenderBase):
             return None
         return Blocks(sections)
 
-    @singledispatchmethod
+    @dispatchmethod
     def render_section(self, el: gf.DocstringSection) -> BlockContent:
         """
         Render a section of a docstring
@@ -429,8 +506,8 @@ class __RenderDoc(RenderBase):
         Notes
         -----
         To render a given type of section differently, register a
-        [](`~functools.singledispatchmethod`) method for that type
-        of section.
+        method for that type of section with `render_section.register`,
+        as you would for a [](`~functools.singledispatchmethod`).
         """
         new_el = qast.transform(el)
         if isinstance(new_el, qast.ExampleCode):
@@ -9,9 +9,10 @@ from types import CellType, FunctionType, MethodType
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Mapping, Sequence
     from typing import Any, TypeVar
 
+    from .._exclude import Pattern
     from .base import RenderBase
 
     T = TypeVar("T")
@@ -100,7 +101,7 @@ def set_class_attr(cls: type[RenderBase], name: str, value: Any):
     setattr(cls, name, value)
 
 
-def exclude_parameters(spec: dict[str, str | Sequence[str]]):
+def exclude_parameters(spec: Mapping[Pattern, Pattern | Sequence[Pattern]]):
     """
     Exclude the parameters of functions/class in the documentation
 
@@ -115,6 +116,9 @@ def exclude_parameters(spec: dict[str, str | Sequence[str]]):
         The object path is as shown on the API page and _not_ the
         canonical path.
 
+        The paths and the names can be glob patterns, e.g. `"pkg.*"` and
+        `"deprecated_*"`, or compiled regular expressions.
+
 
     Examples
     --------
@@ -158,7 +162,7 @@ def exclude_parameters(spec: dict[str, str | Sequence[str]]):
     EXCLUDE_PARAMETERS.update(spec)
 
 
-def exclude_attributes(spec: dict[str, str | Sequence[str]]):
+def exclude_attributes(spec: Mapping[Pattern, Pattern | Sequence[Pattern]]):
     """
     Exclude the parameters of functions/class in the documentation
 
@@ -171,7 +175,10 @@ def exclude_attributes(spec: dict[str, str | Sequence[str]]):
     spec :
         Parent object path and the attribute(s) to exclude.
         The object path is as shown on the API page and _not_ the
-        canonical path. e.g.
+        canonical path.
+
+        The paths and the names can be glob patterns, e.g. `"pkg.*"` and
+        `"deprecated_*"`, or compiled regular expressions.
 
     Examples
     --------
@@ -209,7 +216,7 @@ def exclude_attributes(spec: dict[str, str | Sequence[str]]):
     EXCLUDE_ATTRIBUTES.update(spec)
 
 
-def exclude_functions(spec: dict[str, str | Sequence[str]]):
+def exclude_functions(spec: Mapping[Pattern, Pattern | Sequence[Pattern]]):
     """
     Exclude the methods of a class or functions of a module from documentation
 
@@ -222,7 +229,10 @@ def exclude_functions(spec: dict[str, str | Sequence[str]]):
     spec :
         Parent object path and the function(s) to exclude.
         The object path is as shown on the API page and _not_ the
-        canonical path. e.g.
+        canonical path.
+
+        The paths and the names can be glob patterns, e.g. `"pkg.*"` and
+        `"deprecated_*"`, or compiled regular expressions.
 
     Examples
     --------
@@ -248,13 +258,23 @@ def exclude_functions(spec: dict[str, str | Sequence[str]]):
         "package.ClassA": "func_a",
     })
     ```
+
+    To exclude the functions and methods whose names start with
+    `deprecated_` from all the modules and classes of the package, use
+    patterns.
+
+    ```python
+    exclude_functions({
+        "package.*": "deprecated_*",
+    })
+    ```
     """
     from qrenderer._globals import EXCLUDE_FUNCTIONS
 
     EXCLUDE_FUNCTIONS.update(spec)
 
 
-def exclude_classes(spec: dict[str, str | Sequence[str]]):
+def exclude_classes(spec: Mapping[Pattern, Pattern | Sequence[Pattern]]):
     """
     Exclude the classes in a class or module from the documentation
 
@@ -268,7 +288,10 @@ def exclude_classes(spec: dict[str, str | Sequence[str]]):
     spec :
         Parent object path and the class(es) to exclude.
         The object path is as shown on the API page and _not_ the
-        canonical path. e.g.
+        canonical path.
+
+        The paths and the names can be glob patterns, e.g. `"pkg.*"` and
+        `"deprecated_*"`, or compiled regular expressions.
 
     Examples
     --------
@@ -9,11 +9,12 @@ from quartodoc.pandoc.blocks import (
 from quartodoc.pandoc.components import Attr
 
 from .._format import markdown_escape
+from .._pandoc.blocks import iter_block_chunks
 from .._pandoc.inlines import InterLink
 from .base import RenderBase
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Sequence
 
     from quartodoc.layout import Link
 
@@ -32,11 +33,13 @@ class __RenderLink(RenderBase):
         self.obj = self.link.obj
         """Griffe object"""
 
-    def __str__(self):
+        self.renderer.record_dependency(self.obj.canonical_path)
+
+    def iter_chunks(self) -> Iterator[str]:
         """
-        The Doc object rendered to quarto markdown
+        The Doc object rendered to quarto markdown, in fragments
         """
-        return str(
+        yield from iter_block_chunks(
             Div(
                 Blocks([self.title, self.description, self.body]),
                 Attr(classes=["doc"]),
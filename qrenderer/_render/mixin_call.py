@@ -18,6 +18,8 @@ from .._format import formatted_signature, pretty_code, repr_obj
 from .doc import RenderDoc
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from quartodoc.layout import DocClass, DocFunction
 
     from ..typing import DocstringDefinitionType
@@ -53,7 +55,12 @@ class __RenderDocCallMixin(RenderDoc):
         # rendering needs it.
         self._parameter_kinds = {p.name: p.kind for p in self.parameters}
 
-    @RenderDoc.render_section.register  # type: ignore
+    @property
+    def _sections_context(self) -> Hashable:
+        # The definitions of *args and **kwargs depend on the parameters
+        return tuple(self._parameter_kinds.items())
+
+    @RenderDoc.render_section.register
     def _(self, el: DocstringSectionWithDefinitions):
         """
         Render docstring sections that have a list of definitions
@@ -109,10 +116,7 @@ class __RenderDocCallMixin(RenderDoc):
         obj = self.obj
         parameters = obj.parameters
 
-        exclude = EXCLUDE_PARAMETERS.get(self.obj.path, ())
-        if isinstance(exclude, str):
-            exclude = (exclude,)
-        exclude = set(exclude)
+        exclude = EXCLUDE_PARAMETERS.lookup(self.obj.path)
 
         if not len(parameters) > 0 or not obj.parent:
             return parameters
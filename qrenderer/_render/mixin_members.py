@@ -12,26 +12,33 @@ from quartodoc.pandoc.blocks import (
     Header,
 )
 from quartodoc.pandoc.components import Attr
-from tabulate import tabulate
 
+from .._memo import relocate_member
+from .._pandoc.blocks import StreamingBlock, iter_join_block_content
+from .._pandoc.tables import grid_table
 from .._utils import isDoc
 from .doc import RenderDoc
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from typing import Literal
 
     import griffe as gf
     from quartodoc.layout import DocAttribute, DocFunction, DocModule
 
+    from .._memo import MemberKey
+
 
 @dataclass
-class RenderedMembersGroup(Block):
+class RenderedMembersGroup(StreamingBlock):
     title: Header | None = None
     summary: str | None = None
     members_body: Block | None = None
 
-    def __str__(self):
-        return str(Blocks([self.title, self.summary, self.members_body]))
+    def iter_chunks(self) -> Iterator[str]:
+        yield from iter_join_block_content(
+            [self.title, self.summary, self.members_body]
+        )
 
 
 @dataclass
@@ -96,10 +103,7 @@ class __RenderDocMembersMixin(RenderDoc):
         """
         from qrenderer._globals import EXCLUDE_ATTRIBUTES
 
-        exclude = EXCLUDE_ATTRIBUTES.get(self.obj.path, ())
-        if isinstance(exclude, str):
-            exclude = (exclude,)
-        exclude = set(exclude)
+        exclude = EXCLUDE_ATTRIBUTES.lookup(self.obj.path)
 
         return [
             x
@@ -128,10 +132,7 @@ class __RenderDocMembersMixin(RenderDoc):
         """
         from qrenderer._globals import EXCLUDE_CLASSES
 
-        exclude = EXCLUDE_CLASSES.get(self.obj.path, ())
-        if isinstance(exclude, str):
-            exclude = (exclude,)
-        exclude = set(exclude)
+        exclude = EXCLUDE_CLASSES.lookup(self.obj.path)
 
         return [
             x
@@ -150,10 +151,7 @@ class __RenderDocMembersMixin(RenderDoc):
         """
         from qrenderer._globals import EXCLUDE_FUNCTIONS
 
-        exclude = EXCLUDE_FUNCTIONS.get(self.obj.path, ())
-        if isinstance(exclude, str):
-            exclude = (exclude,)
-        exclude = set(exclude)
+        exclude = EXCLUDE_FUNCTIONS.lookup(self.obj.path)
 
         return [
             x
@@ -239,13 +237,71 @@ class __RenderDocMembersMixin(RenderDoc):
 
         if self.show_members_summary and show_summary:
             rows = [row for r in render_objs for row in r.render_summary()]
-            summary = tabulate(rows, ("Name", "Description"), "grid")
+            summary = grid_table(rows, ("Name", "Description"))
         else:
             summary = None
 
-        body = Blocks(render_objs) if show_body else None
+        body = (
+            Blocks([self._render_member(r) for r in render_objs])
+            if show_body
+            else None
+        )
         return RenderedMembersGroup(title, summary, body)
 
+    def _render_member(self, render: RenderDoc) -> BlockContent:
+        """
+        Render a member, reusing its documentation from other classes
+
+        Parameters
+        ----------
+        render :
+            Render object of the member
+        """
+        key = self._shared_member_key(render)
+        if key is None:
+            return render
+
+        cache = self.renderer.member_cache
+        entry = cache.get(key)
+        if entry is None:
+            with self.renderer.collect_dependencies() as paths:
+                rendered = str(render)
+            entry = rendered, render.obj.path, tuple(paths)
+            cache.set(key, *entry)
+
+        rendered, path, paths = entry
+        for p in paths:
+            self.renderer.record_dependency(p)
+        return relocate_member(rendered, path, render.obj.path)
+
+    def _shared_member_key(self, render: RenderDoc) -> MemberKey | None:
+        """
+        Return the key of a member that can be shared with other classes
+
+        If the documentation of the member depends on its path, there
+        is no key.
+        """
+        from qrenderer._globals import EXCLUDE_PARAMETERS
+
+        # The nested members of a class member have summary tables whose
+        # layout depends on the paths, so they are not shared.
+        renderer = self.renderer
+        if not (
+            renderer.share_inherited_members
+            and self.obj.is_class
+            and not render.obj.is_class
+            and renderer.display_name_format in ("auto", "name", "short")
+            and renderer.signature_name_format in ("name", "short")
+        ):
+            return None
+
+        # Of the objects that can be shared, only the parameters of
+        # functions can be excluded.
+        if EXCLUDE_PARAMETERS.lookup(render.obj.path):
+            return None
+
+        return type(render), render.obj.canonical_path, render.level
+
 
 class RenderDocMembersMixin(__RenderDocMembersMixin, RenderDoc):
     """
@@ -14,11 +14,11 @@ from quartodoc.pandoc.components import Attr
 from quartodoc.pandoc.inlines import Link
 
 from .._format import markdown_escape
-from .._pandoc.blocks import RawHTMLBlockTag
+from .._pandoc.blocks import RawHTMLBlockTag, iter_join_block_content
 from .base import RenderBase
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Sequence
 
     from quartodoc.layout import Page
 
@@ -35,11 +35,13 @@ class __RenderPage(RenderBase):
         self.page = cast("Page", self.layout_obj)
         """Page in the documentation"""
 
-    def __str__(self):
+    def iter_chunks(self) -> Iterator[str]:
         """
-        The Page object rendered to quarto markdown
+        The Page object rendered to quarto markdown, in fragments
         """
-        return str(Blocks([self.title, self.description, self.body]))
+        yield from iter_join_block_content(
+            [self.title, self.description, self.body]
+        )
 
     @property
     def _has_one_object(self):
@@ -106,8 +108,12 @@ class __RenderPage(RenderBase):
             )
             raise ValueError(msg)
         else:
+            from . import summarize
+
             items = [
-                row for d in self.render_objs for row in d.render_summary()
+                row
+                for c in page.contents
+                for row in summarize(c, self.renderer)  # type: ignore
             ]
         return items
 
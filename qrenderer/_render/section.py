@@ -8,15 +8,13 @@ from quartodoc.pandoc.blocks import (
     Header,
 )
 from quartodoc.pandoc.components import Attr
-from tabulate import tabulate
 
+from .._pandoc.tables import grid_table
 from .base import RenderBase
 
 if TYPE_CHECKING:
     from quartodoc.layout import Section
 
-    from qrenderer.typing import RenderObjType
-
 
 class __RenderSection(RenderBase):
     """
@@ -51,15 +49,15 @@ class __RenderSection(RenderBase):
         if not self.section.contents:
             return
 
-        from . import get_render_type
+        from . import summarize
 
-        render_objs: list[RenderObjType] = [
-            get_render_type(c)(c, self.renderer)  # type: ignore
+        rows = [
+            row
             for c in self.section.contents
+            for row in summarize(c, self.renderer)  # type: ignore
         ]
-        rows = [row for r in render_objs for row in r.render_summary()]
         return Div(
-            str(tabulate(rows, tablefmt="grid")),
+            grid_table(rows),
             Attr(classes=["doc-summary-table"]),
         )
 
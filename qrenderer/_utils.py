@@ -1,18 +1,95 @@
 from __future__ import annotations
 
+import os
+import re
+from collections.abc import Sequence
+from contextlib import suppress
 from dataclasses import field
-from typing import TYPE_CHECKING, cast
+from functools import (
+    cached_property,
+    partial,
+    singledispatchmethod,
+    update_wrapper,
+)
+from types import FunctionType
+from typing import TYPE_CHECKING, cast, overload
 
 import griffe as gf
 from quartodoc import layout
+from quartodoc.parsers import get_parser_defaults
 
 if TYPE_CHECKING:
-    from typing import TypeGuard, TypeVar
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+    from typing import Any, TypeGuard, TypeVar
 
     from .typing import DocMemberType, DocType  # noqa: TCH001
 
     T = TypeVar("T")
 
+# A line that may be the title of a google style section, e.g.
+# "Parameters:" or "Note: Some text"
+SECTION_TITLE_RE = re.compile(r"^\s*[A-Za-z][\w ]*:(\s|$)|.*:\s*$")
+
+# A line that may underline the title of a numpy style section
+SECTION_UNDERLINE_RE = re.compile(r"^\s*[-=~^*+#]{3,}\s*$")
+
+
+def write_atomic(filepath: Path, data: bytes):
+    """
+    Write data to a file through a temporary file that then replaces it
+
+    Readers never see a partly written file, and an interrupted write
+    does not leave one behind. The directory of the file is created if
+    it does not exist.
+    """
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = filepath.with_name(f".{filepath.name}.{os.getpid()}.tmp")
+    _ = tmp_path.write_bytes(data)
+    _ = tmp_path.replace(filepath)
+
+
+def write_if_changed(filepath: Path, text: str) -> bool:
+    """
+    Write text to a file unless the file already has the text
+
+    A file that is not written keeps its modification time, so tools
+    that watch the files e.g. `quarto preview` do not process it again.
+    The file is written with [](`~qrenderer._utils.write_atomic`).
+
+    Returns
+    -------
+    :
+        Whether the file was written.
+    """
+    data = text.encode("utf-8")
+    with suppress(FileNotFoundError):
+        if filepath.stat().st_size == len(data) and (
+            filepath.read_bytes() == data
+        ):
+            return False
+
+    write_atomic(filepath, data)
+    return True
+
+
+def make_loader(parser: str = "numpy") -> gf.GriffeLoader:
+    """
+    Create a loader that parses docstrings like quartodoc.get_object
+
+    Pass the same loader to get_object when getting many objects, so
+    that each package is loaded once.
+    """
+    # The options are a plain dict, as quartodoc.get_object passes them.
+    # The docstrings are then parsed in the same way as by quartodoc.
+    options = cast("gf.DocstringOptions", get_parser_defaults(parser))
+    return gf.GriffeLoader(
+        docstring_parser=gf.Parser(parser),
+        docstring_options=options,
+        modules_collection=gf.ModulesCollection(),
+        lines_collection=gf.LinesCollection(),
+    )
+
 
 def is_typealias(obj: gf.Object | gf.Alias) -> bool:
     """
@@ -88,19 +165,157 @@ class isDoc:
         return el.obj.is_attribute
 
 
-def griffe_to_doc(obj: gf.Object | gf.Alias) -> DocType:
+def describe_object(obj: gf.Object | gf.Alias) -> str:
     """
-    Convert griffe object to a quartodoc documentable type
+    Return oneline description of the griffe object
 
-    The function recursively includes all members.
+    This is the first line of the docstring.
     """
-    return layout.Doc.from_griffe(
-        obj.name,
-        obj,
-        members=[griffe_to_doc(m) for m in obj.all_members.values()],
+    if not obj.docstring:
+        return ""
+
+    # Parsing the whole docstring to get the first line is expensive, so
+    # we only use the parsed docstring if it is already available or if
+    # the docstring does not start with plain text.
+    docstring = obj.docstring
+    if "parsed" not in vars(docstring):
+        first, _, rest = docstring.value.lstrip("\n").partition("\n")
+        second = rest.partition("\n")[0]
+        maybe_section = (
+            not first.strip()
+            or first.lstrip().startswith((":", "..", ">>>"))
+            or SECTION_TITLE_RE.match(first)
+            or SECTION_UNDERLINE_RE.match(second)
+        )
+        if not maybe_section:
+            return first
+
+    parts = docstring.parsed
+    section = parts[0] if parts else None
+    return (
+        section.value.split("\n")[0]
+        if isinstance(section, gf.DocstringSectionText)
+        else ""
     )
 
 
+class LazyMembers(Sequence["DocType"]):
+    """
+    Members of a layout.Doc that are converted when first accessed
+
+    Parameters
+    ----------
+    obj :
+        Griffe object whose members are converted.
+    aliases :
+        Whether to include the members that are aliases, i.e. the
+        inherited and imported members.
+    ancestors :
+        Canonical paths of the objects that contain obj. A member that
+        is an alias to any of them is left out, so that a cycle of
+        aliases does not create endless members.
+    """
+
+    def __init__(
+        self,
+        obj: gf.Object | gf.Alias,
+        aliases: bool,
+        ancestors: frozenset[str],
+    ):
+        self._obj = obj
+        self._aliases = aliases
+        self._ancestors = ancestors | {obj.canonical_path}
+
+    @cached_property
+    def _members(self) -> list[DocType]:
+        if self._aliases:
+            objs = self._obj.all_members.values()
+        else:
+            objs = (m for m in self._obj.members.values() if not m.is_alias)
+        return [
+            _make_doc(m, self._aliases, self._ancestors)
+            for m in objs
+            if not (
+                isinstance(m, gf.Alias) and m.target_path in self._ancestors
+            )
+        ]
+
+    @overload
+    def __getitem__(self, index: int) -> DocType: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[DocType]: ...
+
+    def __getitem__(self, index: int | slice) -> DocType | list[DocType]:
+        return self._members[index]
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __iter__(self) -> Iterator[DocType]:
+        return iter(self._members)
+
+    def __repr__(self) -> str:
+        return repr(self._members)
+
+    def __reduce__(self):
+        # Pickle as a plain list
+        return list, (self._members,)
+
+
+# The layout.Doc type for each kind of griffe object
+_DOC_TYPES: dict[str, type[DocType]] = {
+    "function": layout.DocFunction,
+    "attribute": layout.DocAttribute,
+    "class": layout.DocClass,
+    "module": layout.DocModule,
+}
+
+
+def _make_doc(
+    obj: gf.Object | gf.Alias, aliases: bool, ancestors: frozenset[str]
+) -> DocType:
+    """
+    Create a layout.Doc whose members are converted when first accessed
+    """
+    kind = obj.kind.value
+    if kind not in _DOC_TYPES:
+        raise TypeError(f"Cannot handle auto for object kind: {obj.kind}")
+
+    # Validating the fields would convert the members, and the
+    # values are correct by construction.
+    kwargs: dict[str, Any] = {
+        "name": obj.name,
+        "obj": obj,
+        "anchor": obj.path,
+        "signature_name": "relative",
+    }
+    if kind in ("class", "module"):
+        kwargs["members"] = LazyMembers(obj, aliases, ancestors)
+        kwargs["flat"] = False
+    return _DOC_TYPES[kind].construct(**kwargs)
+
+
+def griffe_to_doc(obj: gf.Object | gf.Alias, aliases: bool = True) -> DocType:
+    """
+    Convert griffe object to a quartodoc documentable type
+
+    The members are included at all levels, but they are only converted
+    when they are first accessed. So the parts of the object that are
+    not rendered, e.g. the members of a class that is only summarised,
+    cost nothing.
+
+    Parameters
+    ----------
+    obj :
+        Griffe object to convert
+    aliases :
+        Whether to include the members that are aliases, i.e. the
+        inherited and imported members.
+    """
+    return _make_doc(obj, aliases, frozenset())
+
+
 def no_init(default: T) -> T:
     """
     Set defaut value of a dataclass field that will not be __init__ed
@@ -122,3 +337,77 @@ def is_field_init_false(el: gf.Parameter) -> bool:
     # field has only keyword arguments
     exprs = cast("list[gf.ExprKeyword]", el.default.arguments)
     return any(expr.value == "False" for expr in exprs if expr.name == "init")
+
+
+if TYPE_CHECKING:
+    # singledispatchmethod is generic in the stubs, but it cannot be
+    # subscripted at runtime
+    _singledispatchmethod = singledispatchmethod[Any]
+else:
+    _singledispatchmethod = singledispatchmethod
+
+
+class dispatchmethod(_singledispatchmethod):
+    """
+    Single-dispatch method that resolves each type once
+
+    It is registered to in the same way as a
+    [](`~functools.singledispatchmethod`), but the implementation for
+    each type of argument is looked up once and kept in a table.
+    Accessing the method on an instance only binds the instance with
+    a [](`~functools.partial`), instead of creating a new dispatching
+    function.
+
+    As with singledispatchmethod, there is one registry for the method,
+    so the implementations registered from a subclass apply to all the
+    classes that have the method. The table is also shared by them.
+    """
+
+    def __init__(self, func: Callable[..., Any]):
+        super().__init__(func)
+        _ = update_wrapper(self, func)  # pyright: ignore[reportArgumentType]
+        self.table: dict[type, Callable[..., Any]] = {}
+        """Implementation for each type of argument dispatched so far"""
+
+    def register(self, cls: Any, method: Callable[..., Any] | None = None):
+        """
+        Register an implementation for a type
+
+        Parameters
+        ----------
+        cls :
+            Type of argument or the annotated implementation.
+        method :
+            Implementation, if cls is a type.
+        """
+        result = super().register(cls, method)
+        self.table.clear()
+        return result
+
+    def __get__(self, obj: Any, cls: type[Any] | None = None) -> Any:
+        if obj is None:
+            return self
+        return partial(self._call, obj)
+
+    def _call(self, obj: Any, arg: Any, *args: Any, **kwargs: Any) -> Any:
+        try:
+            method = self.table[arg.__class__]
+        except KeyError:
+            method = self._resolve(arg.__class__)
+        return method(obj, arg, *args, **kwargs)
+
+    def _resolve(self, klass: type) -> Callable[..., Any]:
+        """
+        Lookup and store the implementation for a type of argument
+        """
+        impl = self.dispatcher.dispatch(klass)
+        if isinstance(impl, FunctionType):
+            method = impl
+        else:
+            # e.g. staticmethod and classmethod implementations
+            def method(obj: Any, *args: Any, **kwargs: Any) -> Any:
+                owner: type[Any] = type(obj)
+                return impl.__get__(obj, owner)(*args, **kwargs)
+
+        self.table[klass] = method
+        return method
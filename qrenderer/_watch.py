@@ -0,0 +1,218 @@
+"""
+Rebuilding the documentation when the sources change
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from contextlib import suppress
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ._build import build
+from ._utils import make_loader
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import griffe as gf
+    from quartodoc import Builder, layout
+
+    from ._qrenderer import QRenderer
+
+
+Snapshot = dict[Path, int]
+
+
+class Watcher:
+    """
+    Build the documentation and rebuild it when the sources change
+
+    The process stays warm between builds. The griffe objects of the
+    packages that have not changed, the renderer and its caches are kept,
+    and only the pages whose objects have changed are rendered again.
+    The renderer has to be incremental for that.
+
+    A package is the unit that is loaded again. Griffe objects refer to
+    each other across modules e.g. through aliases and base classes,
+    so a changed module cannot be swapped into a loaded package.
+
+    Parameters
+    ----------
+    builder :
+        Builder of the documentation. Its renderer must be a QRenderer.
+    config_path :
+        The quarto configuration file. If it or the module that defines
+        the renderer changes, the watcher stops so that the caller can
+        start again with the new configuration and Render classes.
+    filter :
+        Only render and write the pages whose paths match this pattern.
+    """
+
+    def __init__(
+        self,
+        builder: Builder,
+        config_path: Path,
+        filter: str = "*",
+    ):
+        self.builder = builder
+        self.renderer: QRenderer = builder.renderer  # pyright: ignore[reportAttributeAccessIssue]
+        self.filter = filter
+        self.loader = make_loader(builder.parser)
+        self.renderer.loader = self.loader
+
+        self.config_files = {config_path.absolute()}
+        """The configuration and the module that defines the renderer"""
+
+        module = type(self.renderer).__module__
+        filename = getattr(sys.modules[module], "__file__", None)
+        if filename and module.split(".")[0] != "qrenderer":
+            self.config_files.add(Path(filename).absolute())
+
+        self.packages = {
+            builder.package,
+            *(p.split(".", 1)[0] for p in self.renderer.typing_module_paths),
+        }
+        """Top level names of the packages whose sources are watched"""
+
+    def blueprint(self) -> layout.Layout:
+        """
+        Return the blueprint of the documentation
+
+        The objects are got through the loader of the watcher, so the
+        packages that are already loaded are not loaded again.
+        """
+        from quartodoc.autosummary import get_object
+        from quartodoc.builder.blueprint import BlueprintTransformer
+
+        trans = BlueprintTransformer(
+            get_object=partial(get_object, loader=self.loader),
+            parser=self.builder.parser,
+        )
+        if self.builder.dynamic is not None:
+            trans.dynamic = self.builder.dynamic
+        return trans.visit(self.builder.layout)
+
+    def build(self):
+        """
+        Build the documentation
+        """
+        build(self.builder, self.blueprint(), self.filter)
+
+    def package_dir(self, package: str) -> Path | None:
+        """
+        Return the directory (or file) with the sources of a package
+        """
+        try:
+            module: gf.Module = self.loader.modules_collection[package]
+        except KeyError:
+            return None
+
+        filepath = module.filepath
+        if isinstance(filepath, list):
+            # A namespace package
+            return filepath[0] if filepath else None
+        return filepath.parent if module.is_package else filepath
+
+    def snapshot(self) -> Snapshot:
+        """
+        Return the modification times of the watched files
+        """
+        files: list[Path] = [*self.config_files]
+        for package in self.packages:
+            path = self.package_dir(package)
+            if path is None:
+                continue
+            elif path.is_dir():
+                files.extend(path.rglob("*.py"))
+                files.extend(path.rglob("*.pyi"))
+            else:
+                files.append(path)
+
+        snapshot: Snapshot = {}
+        for f in files:
+            with suppress(FileNotFoundError):
+                snapshot[f] = f.stat().st_mtime_ns
+        return snapshot
+
+    def changed_packages(self, files: Iterable[Path]) -> set[str]:
+        """
+        Return the watched packages that have any of the files
+        """
+        changed: set[str] = set()
+        for package in self.packages:
+            path = self.package_dir(package)
+            if path and any(f == path or path in f.parents for f in files):
+                changed.add(package)
+        return changed
+
+    def reload(self, packages: Iterable[str]):
+        """
+        Forget the packages so that they are loaded in the next build
+        """
+        collection = self.loader.modules_collection
+        for package in packages:
+            if package in collection:
+                del collection[package]
+        self.renderer.objects_changed()
+
+    def watch(self, interval: float = 1, builds: int | None = None) -> bool:
+        """
+        Build the documentation and rebuild it when the sources change
+
+        Parameters
+        ----------
+        interval :
+            Seconds between checks for changes
+        builds :
+            Stop after this many builds. If None, keep watching until
+            interrupted.
+
+        Returns
+        -------
+        :
+            Whether the watching stopped because the configuration
+            changed.
+        """
+        self.build()
+        count = 1
+        before = self.snapshot()
+        print(f"Watching {', '.join(sorted(self.packages))} for changes...")
+        try:
+            while builds is None or count < builds:
+                time.sleep(interval)
+                after = self.snapshot()
+                files = {
+                    f
+                    for f in before.keys() | after.keys()
+                    if before.get(f) != after.get(f)
+                }
+                before = after
+                if not files:
+                    continue
+                elif files & self.config_files:
+                    print("The configuration has changed.")
+                    return True
+
+                start = time.perf_counter()
+                self.reload(self.changed_packages(files))
+                self.build()
+                count += 1
+                print(f"Rebuilt in {time.perf_counter() - start:.2f}s")
+        except KeyboardInterrupt:
+            pass
+        return False
+
+
+def restart():
+    """
+    Replace this process with a new run of the same command
+    """
+    _ = sys.stdout.flush()
+    _ = sys.stderr.flush()
+    os.execv(
+        sys.executable, [sys.executable, "-m", "qrenderer", *sys.argv[1:]]
+    )
@@ -4,6 +4,8 @@ Little functions that can be used in userland
 
 from __future__ import annotations
 
+from pathlib import Path
+from textwrap import dedent
 from typing import TYPE_CHECKING
 
 import griffe as gf
@@ -17,16 +19,19 @@ from qrenderer import (
     RenderDocFunction,
     RenderDocModule,
 )
+from qrenderer._parallel import num_jobs, render_objects_parallel
+from qrenderer._utils import griffe_to_doc, make_loader
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
     from types import MethodType
 
-    from qrenderer.typing import DocType
-
 
 __all__ = (
     "render_code_variable",
+    "render_code_variables",
     "render_type_object",
+    "render_type_objects",
 )
 
 
@@ -42,22 +47,13 @@ def _canonical_path(klass: type | MethodType) -> str:
     return f"{module}.{klass.__qualname__}"
 
 
-def _render(obj: gf.Object):
+def _render(obj: gf.Object, renderer: QRenderer | None = None):
     """
     Render gf.Object to qmd
     """
-
-    def toDocObject(obj: gf.Object) -> "DocType":
-        members = [
-            toDocObject(m)
-            for m in obj.members.values()
-            # imported variables are of type gf.Alias and we are
-            # not interested in dealing with them.
-            if not isinstance(m, gf.Alias)
-        ]
-        return layout.Doc.from_griffe(obj.name, obj, members=members)
-
-    match layout_obj := toDocObject(obj):
+    # imported variables are of type gf.Alias and we are
+    # not interested in dealing with them.
+    match layout_obj := griffe_to_doc(obj, aliases=False):
         case layout.DocAttribute():
             _Render = RenderDocAttribute
         case layout.DocClass():
@@ -67,7 +63,46 @@ def _render(obj: gf.Object):
         case layout.DocModule():
             _Render = RenderDocModule
 
-    return str(_Render(layout_obj, QRenderer()))
+    return str(_Render(layout_obj, renderer or QRenderer()))
+
+
+def _visit_code(loader: gf.GriffeLoader, code: str, i: int) -> gf.Module:
+    """
+    Visit code in memory as the `__init__.py` of a package named "package"
+
+    The module replaces any other "package" in the loader, so it has to
+    be rendered before the next piece of code is visited.
+
+    Parameters
+    ----------
+    loader :
+        Loader whose extensions and collections are used
+    code :
+        Source code of the package
+    i :
+        Number that makes the (fake) filepath of the code unique
+    """
+    code = dedent(code)
+    filepath = Path(f"<code-{i}>/package/__init__.py")
+    loader.lines_collection[filepath] = code.splitlines()
+    module = gf.visit(
+        "package",
+        filepath,
+        code,
+        extensions=loader.extensions,
+        docstring_parser=loader.docstring_parser,
+        docstring_options=loader.docstring_options,
+        lines_collection=loader.lines_collection,
+        modules_collection=loader.modules_collection,
+    )
+    loader.modules_collection["package"] = module
+    loader.expand_exports(module)
+    loader.expand_wildcards(module, external=False)
+    # Older versions of griffe call the event on_package_loaded
+    for event in ("on_package", "on_package_loaded"):
+        if hasattr(gf.Extension, event):
+            loader.extensions.call(event, pkg=module, loader=loader)
+    return module
 
 
 def render_code_variable(code: str, name: str | None = None) -> str:
@@ -76,11 +111,35 @@ def render_code_variable(code: str, name: str | None = None) -> str:
 
     If name is None, return code rendered as a module
     """
-    with gf.temporary_visited_package(
-        "package", {"__init__.py": code}, docstring_parser="numpy"
-    ) as m:
-        obj = m[name] if name else m
-    return _render(obj)
+    return render_code_variables([(code, name)])[0]
+
+
+def render_code_variables(
+    snippets: Iterable[tuple[str, str | None]],
+) -> list[str]:
+    """
+    Render named variables in many pieces of code to qmd
+
+    All the code is visited in memory through one loader, which is much
+    faster than creating a temporary package for each piece of code.
+
+    Parameters
+    ----------
+    snippets :
+        Pairs of code and the name of the variable to render. If the
+        name is None, the code is rendered as a module.
+
+    Returns
+    -------
+    :
+        The qmd of each piece of code, in the same order as the input.
+    """
+    loader = gf.GriffeLoader(docstring_parser=gf.Parser.numpy)
+    results: list[str] = []
+    for i, (code, name) in enumerate(snippets):
+        m = _visit_code(loader, code, i)
+        results.append(_render(m[name] if name else m))
+    return results
 
 
 def render_type_object(path: str | type | MethodType) -> str:
@@ -92,3 +151,52 @@ def render_type_object(path: str | type | MethodType) -> str:
     if not isinstance(path, str):
         path = _canonical_path(path)
     return _render(get_object(path))
+
+
+def render_type_objects(
+    paths: Sequence[str | type | MethodType],
+    jobs: int = 1,
+) -> dict[str, str]:
+    """
+    Render many python objects to qmd
+
+    The objects are got through one loader, so each package is loaded
+    once, and they are rendered by one renderer.
+
+    Parameters
+    ----------
+    paths :
+        Paths of the objects and/or the objects
+    jobs :
+        Number of processes used to render the objects. If less than 1,
+        use as many processes as there are cpus.
+
+    Returns
+    -------
+    :
+        The qmd of each object, keyed by its path. The path of a python
+        object is its canonical path.
+    """
+    # Group the paths by package, so that the objects in a package are
+    # got one after the other once the package has been loaded
+    packages: dict[str, list[str]] = {}
+    for path in paths:
+        if not isinstance(path, str):
+            path = _canonical_path(path)
+        package = path.split(":", 1)[0].split(".", 1)[0]
+        packages.setdefault(package, []).append(path)
+
+    loader = make_loader()
+    objs = {
+        path: get_object(path, loader=loader)
+        for package_paths in packages.values()
+        for path in package_paths
+    }
+
+    renderer = QRenderer()
+    jobs = min(num_jobs(jobs), len(objs))
+    if jobs > 1:
+        contents = render_objects_parallel(renderer, list(objs.values()), jobs)
+    else:
+        contents = [_render(obj, renderer) for obj in objs.values()]
+    return dict(zip(objs, contents))
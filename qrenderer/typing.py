@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Literal, TypeAlias
+from typing import TYPE_CHECKING, Literal, TypeAlias
 
 import griffe as gf
 from quartodoc.layout import (
@@ -17,16 +17,17 @@ from quartodoc.layout import (
 )
 from quartodoc.pandoc.blocks import InlineContent
 
-from qrenderer import (
-    RenderDoc,
-    RenderDocAttribute,
-    RenderDocClass,
-    RenderDocFunction,
-    RenderDocModule,
-    RenderLayout,
-    RenderPage,
-    RenderSection,
-)
+if TYPE_CHECKING:
+    from qrenderer import (
+        RenderDoc,
+        RenderDocAttribute,
+        RenderDocClass,
+        RenderDocFunction,
+        RenderDocModule,
+        RenderLayout,
+        RenderPage,
+        RenderSection,
+    )
 
 DisplayNameFormat: TypeAlias = Literal[
     "full", "name", "short", "relative", "canonical"
@@ -66,16 +67,18 @@ Documentable: TypeAlias = (
     | Layout
 )
 
-RenderObjType: TypeAlias = (
-    RenderDoc
-    | RenderDocClass
-    | RenderDocFunction
-    | RenderDocAttribute
-    | RenderDocModule
-    | RenderLayout
-    | RenderPage
-    | RenderSection
-)
+if TYPE_CHECKING:
+    RenderObjType: TypeAlias = (
+        RenderDoc
+        | RenderDocClass
+        | RenderDocFunction
+        | RenderDocAttribute
+        | RenderDocModule
+        | RenderLayout
+        | RenderPage
+        | RenderSection
+    )
+
 
 Annotation: TypeAlias = str | gf.Expr
 
@@ -84,3 +87,26 @@ DocType: TypeAlias = DocClass | DocFunction | DocAttribute | DocModule
 DocMemberType: TypeAlias = MemberPage | Doc | Link
 
 SummaryItem: TypeAlias = tuple[InlineContent, InlineContent]
+
+
+def __getattr__(name: str):
+    # Importing the render classes is slow, so RenderObjType is created
+    # when it is first used at runtime
+    if name != "RenderObjType":
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    import qrenderer as q
+
+    value = (
+        q.RenderDoc
+        | q.RenderDocClass
+        | q.RenderDocFunction
+        | q.RenderDocAttribute
+        | q.RenderDocModule
+        | q.RenderLayout
+        | q.RenderPage
+        | q.RenderSection
+    )
+    globals()[name] = value
+    return value
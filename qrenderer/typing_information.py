@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import cached_property
 from pathlib import Path
+from time import perf_counter
 from typing import TYPE_CHECKING, cast
 
 from quartodoc import layout
@@ -14,22 +15,59 @@ from quartodoc.pandoc.blocks import (
     Header,
 )
 
-from ._pandoc.blocks import Meta
+from ._pandoc.blocks import Meta, StreamingBlock, iter_block_chunks
 from ._render import (
     RenderDocAttribute,
     RenderDocClass,
     get_render_type,
 )
-from ._utils import griffe_to_doc, is_protocol, is_typealias, is_typevar
+from ._utils import (
+    griffe_to_doc,
+    is_protocol,
+    is_typealias,
+    is_typevar,
+    write_if_changed,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     import griffe as gf
 
     from ._qrenderer import QRenderer
 
 
+def classify_members(
+    members: Iterable[gf.Object | gf.Alias],
+) -> tuple[
+    list[gf.Object | gf.Alias],
+    list[gf.Object | gf.Alias],
+    list[gf.Object | gf.Alias],
+]:
+    """
+    Separate the protocols, typevars and typealiases in the members
+
+    Returns
+    -------
+    :
+        The protocols, typevars and typealiases, each in the order of
+        the members. Other members are left out.
+    """
+    protocols: list[gf.Object | gf.Alias] = []
+    typevars: list[gf.Object | gf.Alias] = []
+    typealiases: list[gf.Object | gf.Alias] = []
+    for m in members:
+        if is_protocol(m):
+            protocols.append(m)
+        if is_typevar(m):
+            typevars.append(m)
+        if is_typealias(m):
+            typealiases.append(m)
+    return protocols, typevars, typealiases
+
+
 @dataclass
-class TypeSections(Block):
+class TypeSections(StreamingBlock):
     protocols_items: list[layout.Item]
     typevars_items: list[layout.Item]
     typealiases_items: list[layout.Item]
@@ -67,8 +105,8 @@ class TypeSections(Block):
             r.show_signature_name = False
             r.show_signature_annotation = False
 
-    def __str__(self):
-        return str(self.render_body())
+    def iter_chunks(self) -> Iterator[str]:
+        yield from iter_block_chunks(cast("Block", self.render_body()))
 
     @cached_property
     def items(self) -> list[layout.Item]:
@@ -88,7 +126,7 @@ class TypeSections(Block):
             content.extend(
                 [
                     Header(2, "Protocols"),
-                    *[str(r) for r in self.protocols_renders],
+                    *self.protocols_renders,
                 ]
             )
 
@@ -96,7 +134,7 @@ class TypeSections(Block):
             content.extend(
                 [
                     Header(2, "Type Variables"),
-                    *[str(r) for r in self.typevars_renders],
+                    *self.typevars_renders,
                 ]
             )
 
@@ -104,7 +142,7 @@ class TypeSections(Block):
             content.extend(
                 [
                     Header(2, "Type Aliases"),
-                    *[str(r) for r in self.typealiases_renders],
+                    *self.typealiases_renders,
                 ]
             )
 
@@ -112,17 +150,24 @@ class TypeSections(Block):
 
 
 @dataclass
-class TypeInformation(Block):
+class TypeInformation(StreamingBlock):
     module_path: str
     renderer: QRenderer
     builder: Builder
+    loader: gf.GriffeLoader | None = field(default=None, repr=False)
+    """
+    Loader of the module
+
+    Share a loader among the typing modules of a package, so that the
+    package is loaded once.
+    """
 
     def __post_init__(self):
         self.package = self.builder.package
         self.dir = self.builder.dir
 
-    def __str__(self):
-        return str(self.content)
+    def iter_chunks(self) -> Iterator[str]:
+        yield from iter_block_chunks(self.content)
 
     @cached_property
     def base_uri(self) -> str:
@@ -153,25 +198,45 @@ class TypeInformation(Block):
                 dispname=obj.canonical_path,
             )
 
-        members = list(get_object(self.module_path).members.values())
+        obj = get_object(self.module_path, loader=self.loader)
+        protocols, typevars, typealiases = classify_members(
+            obj.members.values()
+        )
         return TypeSections(
-            protocols_items=[make_item(m) for m in members if is_protocol(m)],
-            typevars_items=[make_item(m) for m in members if is_typevar(m)],
-            typealiases_items=[
-                make_item(m) for m in members if is_typealias(m)
-            ],
+            protocols_items=[make_item(m) for m in protocols],
+            typevars_items=[make_item(m) for m in typevars],
+            typealiases_items=[make_item(m) for m in typealiases],
             renderer=self.renderer,
         )
 
     @cached_property
-    def content(self) -> BlockContent:
+    def content(self) -> Block:
         meta = Meta({"title": "Typing Information"})
         return Blocks([meta, self.sections])
 
+    @cached_property
+    def filepath(self) -> Path:
+        """
+        Path of the qmd file with the typing information
+        """
+        return Path(f"{self.base_uri}.qmd")
+
+    def render_timed(self) -> tuple[str, float]:
+        """
+        Render the typing information and time it
+
+        Returns
+        -------
+        :
+            The rendered typing information and the seconds it took.
+        """
+        start = perf_counter()
+        content = str(self)
+        return content, perf_counter() - start
+
     def write(self):
         """
         Write typing information to qmd file
         """
         self.builder.items.extend(self.sections.items)
-        filepath = Path(f"{self.base_uri}.qmd")
-        _ = filepath.write_text(str(self))
+        _ = write_if_changed(self.filepath, str(self))
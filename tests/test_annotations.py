@@ -0,0 +1,61 @@
+from qrenderer import QRenderer, RenderDoc
+
+from .utils import render_pages
+
+code = '''
+class Foo:
+    """
+    Class Foo
+    """
+
+def func_a(a: list[Foo] | None = None, b: int = 1):
+    """
+    Function A
+
+    Parameters
+    ----------
+    a :
+        Parameter a
+    b :
+        Parameter b
+    """
+
+def func_b(a: list[Foo] | None = None, b: str = "b"):
+    """
+    Function B
+
+    Parameters
+    ----------
+    a :
+        Parameter a
+    b :
+        Parameter b
+    """
+'''
+
+names = ["func_a", "func_b"]
+
+
+def test_annotation_cache(monkeypatch):
+    renderer = QRenderer()
+    (qmd_a, deps_a), (qmd_b, deps_b) = render_pages(renderer, code, names)
+    cache = renderer.annotation_cache
+
+    # The annotation of parameter a is rendered once
+    assert cache.misses == 3
+    assert cache.hits == 1
+    assert "[Foo](`package.Foo`)" in qmd_b
+
+    # A hit records the dependencies of the annotation
+    assert "package.Foo" in deps_a
+    assert "package.Foo" in deps_b
+
+    # Opting out gives the same output
+    monkeypatch.setattr(RenderDoc, "memoize_annotations", False)
+    renderer2 = QRenderer()
+    assert render_pages(renderer2, code, names) == [
+        (qmd_a, deps_a),
+        (qmd_b, deps_b),
+    ]
+    assert renderer2.annotation_cache.hits == 0
+    assert renderer2.annotation_cache.misses == 0
@@ -0,0 +1,70 @@
+from qrenderer import QRenderer
+
+from .utils import visited_pages
+
+
+def render_page(
+    code: str, name: str, renderer: QRenderer, aliases: bool = True
+) -> str:
+    with visited_pages(code, [name], aliases) as pages:
+        return renderer.render(pages[0])
+
+
+def test_page_cache(tmp_path, monkeypatch):
+    code = '''
+    def func(a: int = 1):
+        """
+        A function
+        """
+    '''
+    renderer = QRenderer(cache_dir=str(tmp_path))
+    qmd = render_page(code, "func", renderer)
+    assert len(list(tmp_path.glob("*/*.qmd"))) == 1
+
+    # A hit does not render the page
+    def fail(el):
+        raise AssertionError("Page should not be rendered")
+
+    monkeypatch.setattr(renderer, "_render_page", fail)
+    assert render_page(code, "func", renderer) == qmd
+
+    # A changed docstring is a miss
+    monkeypatch.undo()
+    qmd2 = render_page(code.replace("A function", "Changed"), "func", renderer)
+    assert "Changed" in qmd2
+    assert len(list(tmp_path.glob("*/*.qmd"))) == 2
+
+    # A different configuration is a miss
+    renderer2 = QRenderer(cache_dir=str(tmp_path), show_signature=False)
+    render_page(code, "func", renderer2)
+    assert len(list(tmp_path.glob("*/*.qmd"))) == 3
+
+
+def test_page_cache_inherited_field(tmp_path):
+    code = '''
+    from dataclasses import dataclass
+
+    @dataclass
+    class Base:
+        """
+        Base class
+        """
+
+        a: int = 1
+        """Parameter a ORIGINAL"""
+
+    @dataclass
+    class Derived(Base):
+        """
+        Derived class
+        """
+    '''
+    # The inherited members are not documented, but the docstring of the
+    # inherited field is rendered with the parameters of the subclass
+    renderer = QRenderer(cache_dir=str(tmp_path))
+    qmd = render_page(code, "Derived", renderer, aliases=False)
+    assert "ORIGINAL" in qmd
+
+    code2 = code.replace("ORIGINAL", "EDITED")
+    qmd2 = render_page(code2, "Derived", renderer, aliases=False)
+    assert "EDITED" in qmd2
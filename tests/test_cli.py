@@ -0,0 +1,132 @@
+import json
+from textwrap import dedent
+
+import pytest
+
+from qrenderer._cli import main
+
+code = '''
+def func_a(a: int = 1):
+    """
+    Function A
+    """
+
+def func_b(b: str = "b"):
+    """
+    Function B
+    """
+'''
+
+config = """
+quartodoc:
+  dir: reference
+  package: package
+  renderer:
+    style: _renderer.py
+  sections:
+    - title: Functions
+      contents:
+        - func_a
+        - func_b
+"""
+
+renderer = """
+from qrenderer import QRenderer
+
+class Renderer(QRenderer):
+    pass
+"""
+
+
+def test_build(tmp_path):
+    (tmp_path / "package").mkdir()
+    (tmp_path / "package/__init__.py").write_text(dedent(code))
+    (tmp_path / "_quarto.yml").write_text(config)
+    (tmp_path / "_renderer.py").write_text(renderer)
+
+    args = ["build", "--config", str(tmp_path / "_quarto.yml")]
+    main([*args, "--only", "func_a", "--profile", str(tmp_path / "prof")])
+    reference = tmp_path / "reference"
+    assert "Function A" in (reference / "func_a.qmd").read_text()
+    assert not (reference / "func_b.qmd").exists()
+    assert "RenderDocFunction" in (tmp_path / "prof").read_text()
+
+    main([*args, "--jobs", "2"])
+    assert "Function B" in (reference / "func_b.qmd").read_text()
+
+    # The files whose content has not changed are not written again
+    mtimes = {p: p.stat().st_mtime_ns for p in reference.iterdir()}
+    main(args)
+    assert {p: p.stat().st_mtime_ns for p in reference.iterdir()} == mtimes
+
+    with pytest.raises(SystemExit, match="requires a cache_dir"):
+        main([*args, "--incremental"])
+
+
+def test_build_fast_inventory(tmp_path):
+    (tmp_path / "package").mkdir()
+    (tmp_path / "package/__init__.py").write_text(dedent(code))
+    (tmp_path / "_quarto.yml").write_text(
+        f"{config}\ninterlinks:\n  fast: true\n"
+    )
+    (tmp_path / "_renderer.py").write_text(renderer)
+
+    main(["build", "--config", str(tmp_path / "_quarto.yml")])
+    assert "package.func_a" in (tmp_path / "objects.txt").read_text()
+    assert not (tmp_path / "objects.json").exists()
+
+
+def test_manifest(tmp_path):
+    (tmp_path / "package").mkdir()
+    (tmp_path / "package/__init__.py").write_text(dedent(code))
+    (tmp_path / "_quarto.yml").write_text(config)
+    (tmp_path / "_renderer.py").write_text(renderer)
+
+    args = [
+        "build",
+        "--config",
+        str(tmp_path / "_quarto.yml"),
+        "--incremental",
+        "--cache-dir",
+        str(tmp_path / "cache"),
+        "--manifest",
+        str(tmp_path / "manifest.json"),
+    ]
+
+    def read_manifest():
+        return json.loads((tmp_path / "manifest.json").read_text())
+
+    main(args)
+    manifest = read_manifest()
+    files = manifest["files"]
+    assert set(files) == {
+        "reference/index.qmd",
+        "reference/func_a.qmd",
+        "reference/func_b.qmd",
+    }
+    assert manifest["changed"] == sorted(files)
+    record = files["reference/func_a.qmd"]
+    assert "package.func_a" in record["objects"]
+    assert record["size"] == (tmp_path / "reference/func_a.qmd").stat().st_size
+    assert record["render_time"] > 0
+
+    # The index summarizes all the objects
+    index = files["reference/index.qmd"]
+    assert {"package.func_a", "package.func_b"} <= set(index["objects"])
+    assert index["render_time"] > 0
+
+    # Only the page whose object has changed is rendered again
+    new_code = code.replace("Function B\n", "Function B\n\n    More\n")
+    (tmp_path / "package/__init__.py").write_text(dedent(new_code))
+    main(args)
+    manifest = read_manifest()
+    files = manifest["files"]
+    assert manifest["changed"] == ["reference/func_b.qmd"]
+    assert files["reference/func_a.qmd"]["render_time"] is None
+    assert "package.func_a" in files["reference/func_a.qmd"]["objects"]
+
+    (tmp_path / "reference/func_b.qmd").unlink()
+    main([*args, "--only", "func_a"])
+    manifest = read_manifest()
+    assert manifest["changed"] == []
+    assert manifest["removed"] == ["reference/func_b.qmd"]
@@ -0,0 +1,64 @@
+import re
+
+from qrenderer._exclude import Exclusions
+from qrenderer._globals import EXCLUDE_FUNCTIONS, EXCLUDE_PARAMETERS
+from qrenderer.tools import render_code_variable
+
+
+def test_exclusions():
+    exclusions = Exclusions()
+    exclusions.update(
+        {
+            "pkg.mod": "a",
+            "pkg.Class": ("b", "c"),
+            "pkg.*": "deprecated_*",
+            re.compile(r"pkg\.mod\d"): re.compile("old_.+"),
+        }
+    )
+
+    mod = exclusions.lookup("pkg.mod")
+    assert "a" in mod
+    assert "deprecated_x" in mod
+    assert "b" not in mod
+    assert "old_x" not in mod
+
+    cls = exclusions.lookup("pkg.Class")
+    assert "b" in cls and "c" in cls
+
+    mod1 = exclusions.lookup("pkg.mod1")
+    assert "old_x" in mod1
+    assert "old_" not in mod1
+    assert "deprecated_x" in mod1
+
+    assert not exclusions.lookup("other")
+    assert "a" not in exclusions.lookup("other")
+
+    # A change is seen by the next lookup
+    exclusions["other"] = "a"
+    assert "a" in exclusions.lookup("other")
+    del exclusions["other"]
+    assert not exclusions.lookup("other")
+
+
+def test_exclude_patterns(monkeypatch):
+    code = '''
+    class ClassA:
+        """
+        Class A
+        """
+
+        def func_a(self, a: int, old_b: int = 1):
+            """
+            Function a
+            """
+
+        def deprecated_func(self):
+            """
+            Deprecated function
+            """
+    '''
+    monkeypatch.setitem(EXCLUDE_FUNCTIONS, "package.*", "deprecated_*")
+    monkeypatch.setitem(EXCLUDE_PARAMETERS, "*.func_?", "old_*")
+    qmd = render_code_variable(code, "ClassA")
+    assert "func_a(a)" in qmd
+    assert "deprecated_func" not in qmd
@@ -0,0 +1,52 @@
+import random
+import re
+from textwrap import dedent
+
+from quartodoc.pandoc.components import Attr
+from quartodoc.pandoc.inlines import Span
+
+from qrenderer._format import escape_indents, escape_quotes, pretty_code
+
+# The implementation of pretty_code before it became a single pass
+ORIGINAL_STRING_RE = re.compile(
+    r"(?P<string>"
+    r'"(?:\\.|[^"\\])*"'
+    r"|"
+    r"'(?:\\.|[^'\\])*'"
+    ")",
+    flags=re.UNICODE,
+)
+
+
+def original_pretty_code(s: str) -> str:
+    def highlight(m: re.Match[str]) -> str:
+        return str(Span(m.group("string"), Attr(classes=["st"])))
+
+    highlighted = ORIGINAL_STRING_RE.sub(highlight, dedent(s))
+    return escape_quotes(escape_indents(highlighted))
+
+
+def test_pretty_code_equivalence():
+    examples = [
+        "",
+        "None",
+        "'a'",
+        "'a \"quoted\" string'",
+        '"it\'s"',
+        "'unpaired",
+        "a = 'escaped \\' quote'",
+        "f(x,\n    y='    ',\n    z=\"\\\\\")",
+        "    indented\n        more\n    'less'",
+        "{\n    'a': 1,\n\n    \"b\": [1, 2]\n}",
+        "\t'tab'\n\t\"tab\"",
+        "'multi\nline'",
+        "  \n   'x'",
+    ]
+    for s in examples:
+        assert pretty_code(s) == original_pretty_code(s), s
+
+    rng = random.Random(123)
+    alphabet = ["'", '"', "\\", " ", " " * 4, "\n", "\t", "a", "=", "1"]
+    for _ in range(3000):
+        s = "".join(rng.choices(alphabet, k=rng.randint(0, 20)))
+        assert pretty_code(s) == original_pretty_code(s), repr(s)
@@ -0,0 +1,21 @@
+import subprocess
+import sys
+
+import pytest
+
+import qrenderer
+from qrenderer._render.docclass import RenderDocClass
+
+
+def test_lazy_imports():
+    code = (
+        "import sys, qrenderer, qrenderer.typing\n"
+        "assert 'qrenderer._qrenderer' not in sys.modules\n"
+        "assert 'qrenderer._render' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+    assert qrenderer.RenderDocClass is RenderDocClass
+    assert "QRenderer" in dir(qrenderer)
+    with pytest.raises(AttributeError, match="no attribute 'Missing'"):
+        _ = qrenderer.Missing  # pyright: ignore[reportAttributeAccessIssue]
@@ -0,0 +1,93 @@
+from collections.abc import Sequence
+
+from qrenderer import QRenderer
+
+from .utils import visited_pages
+
+code = '''
+class Base:
+    """
+    Base class
+    """
+
+    def method(self):
+        """
+        Base method
+        """
+
+class Derived(Base):
+    """
+    Derived class
+    """
+
+def func():
+    """
+    A function
+    """
+'''
+
+
+def build(
+    code: str,
+    cache_dir: str,
+    names: Sequence[str] = ("Base", "Derived", "func"),
+    aliases: bool = True,
+) -> list[str]:
+    """
+    Render all pages and return the paths of those that were rendered
+    """
+    rendered: list[str] = []
+
+    renderer = QRenderer(cache_dir=cache_dir, incremental=True)
+    render_page = renderer._render_page
+
+    def _render_page(el):
+        rendered.append(el.path)
+        return render_page(el)
+
+    renderer._render_page = _render_page
+    with visited_pages(code, names, aliases) as pages:
+        renderer.render_pages(pages)
+    renderer._pages_written(builder=None)
+    return rendered
+
+
+def test_incremental_build(tmp_path):
+    cache_dir = str(tmp_path)
+    assert build(code, cache_dir) == ["Base", "Derived", "func"]
+    assert build(code, cache_dir) == []
+
+    # Derived documents the inherited method
+    code2 = code.replace("Base method", "Changed method")
+    assert build(code2, cache_dir) == ["Base", "Derived"]
+
+    code3 = code2.replace("A function", "Changed function")
+    assert build(code3, cache_dir) == ["func"]
+
+
+def test_incremental_build_inherited_field(tmp_path):
+    code = '''
+    from dataclasses import dataclass
+
+    @dataclass
+    class Base:
+        """
+        Base class
+        """
+
+        a: int = 1
+        """Parameter a ORIGINAL"""
+
+    @dataclass
+    class Derived(Base):
+        """
+        Derived class
+        """
+    '''
+    cache_dir = str(tmp_path)
+    names = ["Base", "Derived"]
+    assert build(code, cache_dir, names, aliases=False) == names
+
+    # The docstring of the inherited field is rendered in both pages
+    code2 = code.replace("ORIGINAL", "EDITED")
+    assert build(code2, cache_dir, names, aliases=False) == names
@@ -0,0 +1,60 @@
+from qrenderer import QRenderer
+from qrenderer._globals import EXCLUDE_PARAMETERS
+
+from .utils import render_pages
+
+code = '''
+class Foo:
+    """
+    Foo class
+    """
+
+class Base:
+    """
+    Base class
+    """
+
+    class Nested:
+        """
+        Nested class
+        """
+
+        def method(self, a: Foo):
+            """
+            Nested method
+            """
+
+    def method(self, a: Foo, b: int = 1):
+        """
+        Base method
+        """
+
+class Derived(Base):
+    """
+    Derived class
+    """
+
+class MoreDerived(Derived):
+    """
+    More derived class
+    """
+'''
+
+names = ["Base", "Derived", "MoreDerived"]
+
+
+def test_share_inherited_members(monkeypatch):
+    pages = render_pages(QRenderer(), code, names)
+
+    renderer = QRenderer(share_inherited_members=True)
+    assert render_pages(renderer, code, names) == pages
+    assert renderer.member_cache.misses == 2
+    assert renderer.member_cache.hits == 4
+    assert "{#package.MoreDerived.Nested.method " in pages[2][0]
+
+    # Members whose parameters are excluded by path are not shared
+    monkeypatch.setitem(EXCLUDE_PARAMETERS, "package.Derived.method", "b")
+    renderer2 = QRenderer(share_inherited_members=True)
+    (_, _), (qmd, _), (_, _) = render_pages(renderer2, code, names)
+    assert "method(a)" in qmd
+    assert renderer2.member_cache.hits == 3
@@ -0,0 +1,77 @@
+from textwrap import dedent
+from types import SimpleNamespace
+
+from qrenderer import QRenderer
+
+from .utils import visited_pages
+
+
+def test_render_pages_parallel():
+    code = '''
+    def func_a(a: int = 1):
+        """
+        Function A
+        """
+
+    def func_b(b: str = "b"):
+        """
+        Function B
+        """
+
+    class ClassC:
+        """
+        Class C
+        """
+
+        def method(self, c: float):
+            """
+            Method of class C
+            """
+    '''
+    names = ["func_a", "func_b", "ClassC"]
+    with visited_pages(code, names) as pages:
+        serial = QRenderer().render_pages(pages)
+        parallel = QRenderer(jobs=2).render_pages(pages)
+
+    assert parallel == serial
+    assert [name in qmd for name, qmd in zip(names, parallel)] == [True] * 3
+
+
+def test_write_typing_information_parallel(tmp_path, monkeypatch):
+    typing_code = '''
+    from typing import Protocol, TypeAlias, TypeVar
+
+    T = TypeVar("T")
+
+    Number: TypeAlias = int | float
+
+    class Sized(Protocol):
+        """
+        Sized protocol
+        """
+
+        def size(self) -> int: ...
+    '''
+    package = tmp_path / "package"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "types_a.py").write_text(dedent(typing_code))
+    (package / "types_b.py").write_text(dedent(typing_code))
+    (tmp_path / "reference").mkdir()
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+
+    def write(renderer: QRenderer) -> list[str]:
+        builder = SimpleNamespace(package="package", dir="reference", items=[])
+        renderer._write_typing_information(builder)  # pyright: ignore
+        assert len(builder.items) == 6
+        return [
+            (tmp_path / f"reference/{name}.qmd").read_text()
+            for name in ("types_a", "types_b")
+        ]
+
+    paths = ["package.types_a", "package.types_b"]
+    serial = write(QRenderer(typing_module_paths=paths))
+    parallel = write(QRenderer(typing_module_paths=paths, jobs=2))
+    assert parallel == serial
+    assert "package.types_b.Sized" in serial[1]
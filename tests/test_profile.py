@@ -0,0 +1,53 @@
+from qrenderer import QRenderer
+
+from .utils import visited_pages
+
+
+def test_phase_timings(capsys):
+    code = '''
+    class ClassA:
+        """
+        Class A
+        """
+
+        def method(self, a: int):
+            """
+            Method of class A
+            """
+
+    def func(b: str = "b"):
+        """
+        A function
+        """
+    '''
+    with visited_pages(code, ["ClassA", "func"]) as pages:
+        renderer = QRenderer(profile=True)
+        profiled = renderer.render_pages(pages)
+        assert profiled == QRenderer().render_pages(pages)
+
+        timings = renderer.timings
+        assert timings is not None
+        stats = timings.stats
+        assert stats["RenderDocClass", "class", "body"].calls == 1
+        assert stats["RenderDocFunction", "function", "signature"].calls == 2
+        assert stats["RenderPage", "page", "body"].calls == 2
+
+        # The own time of a phase excludes the nested phases
+        title = stats["RenderPage", "page", "title"]
+        assert title.own < title.total
+
+        by_phase = timings.group(["phase"])
+        assert by_phase["title",].calls == sum(
+            s.calls for k, s in stats.items() if k[2] == "title"
+        )
+
+        # The times from worker processes are collected
+        renderer2 = QRenderer(profile=True, jobs=2)
+        _ = renderer2.render_pages(pages)
+        assert renderer2.timings is not None
+        assert renderer2.timings.group(["phase"]).keys() == by_phase.keys()
+
+    renderer._pages_written(builder=None)  # pyright: ignore
+    report = capsys.readouterr().err
+    assert report.startswith("render_class")
+    assert "RenderDocClass" in report
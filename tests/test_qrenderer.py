@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+
+from qrenderer import QRenderer
+
+from .utils import visited_pages
+
+
+def test_subclass_post_init():
+    code = '''
+    def func(a: int = 1):
+        """
+        A function
+        """
+    '''
+
+    @dataclass
+    class Renderer(QRenderer):
+        style = "post_init"
+
+        def __post_init__(self):
+            pass
+
+    with visited_pages(code, ["func"]) as pages:
+        qmd = Renderer().render(pages[0])
+        assert qmd == QRenderer().render(pages[0])
+    assert "A function" in qmd
@@ -0,0 +1,60 @@
+from qrenderer import QRenderer, RenderDoc
+
+from .utils import render_pages
+
+code = '''
+class Foo:
+    """
+    Class Foo
+    """
+
+class Base:
+    """
+    Base class
+    """
+
+    def method(self, a: Foo, *args: int):
+        """
+        Base method
+
+        Parameters
+        ----------
+        a :
+            Parameter a
+        *args :
+            Other parameters
+        """
+
+class Derived(Base):
+    """
+    Derived class
+    """
+
+class MoreDerived(Derived):
+    """
+    More derived class
+    """
+'''
+
+names = ["Base", "Derived", "MoreDerived"]
+
+
+def test_section_cache(monkeypatch):
+    monkeypatch.setattr(RenderDoc, "memoize_sections", True)
+    renderer = QRenderer()
+    pages = render_pages(renderer, code, names)
+    cache = renderer.section_cache
+
+    # The inherited method is rendered once
+    assert cache.hits == 2
+    assert all("Base method" in qmd for qmd, _ in pages)
+
+    # A hit records the dependencies of the sections
+    assert all("package.Foo" in deps for _, deps in pages)
+
+    # Without memoizing, the output is the same
+    monkeypatch.setattr(RenderDoc, "memoize_sections", False)
+    renderer2 = QRenderer()
+    assert render_pages(renderer2, code, names) == pages
+    assert renderer2.section_cache.hits == 0
+    assert renderer2.section_cache.misses == 0
@@ -0,0 +1,65 @@
+from io import StringIO
+
+import griffe as gf
+from quartodoc.pandoc.blocks import (
+    Blocks,
+    CodeBlock,
+    Div,
+    Header,
+    blockcontent_to_str,
+)
+from quartodoc.pandoc.components import Attr
+
+from qrenderer import QRenderer, RenderDocClass
+from qrenderer._pandoc.blocks import (
+    RawHTMLBlockTag,
+    RenderedDocObject,
+    iter_blockcontent_chunks,
+)
+from qrenderer._utils import griffe_to_doc
+from qrenderer.tools import render_code_variable
+
+
+def test_chunks_match_strings():
+    content = [
+        Header(1, "Title", Attr(classes=["a"])),
+        "text with trailing newlines\n\n",
+        "",
+        None,
+        Div(
+            Blocks(["inner\n", Blocks([]), Div("\n\n"), CodeBlock("x = 1")]),
+            Attr(classes=["b"]),
+        ),
+        Blocks(["last\n\n\n"]),
+        RawHTMLBlockTag("header", Blocks(["raw\n"])),
+        RenderedDocObject(Header(2, "Object"), None, "body\n"),
+        Div("\n"),
+    ]
+    assert "".join(iter_blockcontent_chunks(content)) == blockcontent_to_str(
+        content
+    )
+    assert "".join(iter_blockcontent_chunks(Blocks(content))) == (
+        blockcontent_to_str(Blocks(content))
+    )
+
+
+def test_write_to():
+    code = '''
+    class Base:
+        """
+        Base class
+        """
+
+        def meth(self, a: int = 1):
+            """
+            Method of class Base
+            """
+    '''
+    with gf.temporary_visited_package(
+        "package", {"__init__.py": code}, docstring_parser="numpy"
+    ) as m:
+        render = RenderDocClass(griffe_to_doc(m["Base"]), QRenderer())
+        stream = StringIO()
+        render.write_to(stream)
+
+    assert stream.getvalue() == render_code_variable(code, "Base")
@@ -0,0 +1,119 @@
+import griffe as gf
+from quartodoc import layout
+
+from qrenderer import QRenderer, RenderDocClass, RenderDocFunction
+from qrenderer._render import get_render_type, summarize
+from qrenderer._utils import describe_object, griffe_to_doc
+
+code = '''
+class ClassA:
+    """
+    Class A
+
+    More about class A
+    """
+
+    def method(self, a: int):
+        """
+        Method of class A
+        """
+
+def func(b: str = "b"):
+    """
+    A function
+    """
+
+x: int = 1
+"""An attribute"""
+'''
+
+
+def test_summary_without_render_objects(monkeypatch):
+    renderer = QRenderer()
+    with gf.temporary_visited_package(
+        "package", {"__init__.py": code}, docstring_parser="numpy"
+    ) as m:
+        docs = [griffe_to_doc(m[name]) for name in ("ClassA", "func", "x")]
+        expected = [
+            row
+            for d in docs
+            for row in get_render_type(d)(d, renderer).render_summary()
+        ]
+
+        def fail(*args, **kwargs):
+            raise AssertionError("Render object created")
+
+        with monkeypatch.context() as mp:
+            mp.setattr(RenderDocClass, "__init__", fail)
+            rows = [row for d in docs for row in summarize(d, renderer)]
+        assert rows == expected
+        assert rows[0] == ("[ClassA](ClassA.qmd#package.ClassA)", "Class A")
+
+        page = layout.Page(path="all", contents=docs, flatten=True)
+        assert summarize(page, renderer) == expected
+
+        # Extended summaries are respected
+        monkeypatch.setattr(
+            RenderDocFunction, "summary_name", property(lambda self: "f()")
+        )
+        link, _ = summarize(docs[1], renderer)[0]
+        assert link == "[f()](func.qmd#package.func)"
+
+
+def test_describe_object():
+    code = '''
+    def a():
+        """
+        Function a
+
+        Parameters
+        ----------
+        x : int
+            Parameter x
+        """
+
+    def b():
+        """
+        Parameters
+        ----------
+        x : int
+            Parameter x
+        """
+
+    def c():
+        """
+        .. deprecated:: 0.1.0
+            Use a
+        """
+
+    def d():
+        """Function d"""
+
+    def e():
+        pass
+    '''
+    with gf.temporary_visited_package(
+        "package", {"__init__.py": code}, docstring_parser="numpy"
+    ) as m:
+        descriptions = [describe_object(m[name]) for name in "abcde"]
+
+        # Docstrings that start with plain text are not parsed
+        assert "parsed" not in vars(m["a"].docstring)
+        assert "parsed" not in vars(m["d"].docstring)
+
+        expected = []
+        for name in "abcde":
+            docstring = m[name].docstring
+            parts = docstring.parsed if docstring else []
+            text = parts[0] if parts else None
+            expected.append(
+                text.value.split("\n")[0]
+                if isinstance(text, gf.DocstringSectionText)
+                else ""
+            )
+        assert descriptions == expected
+        assert descriptions[:2] == ["Function a", ""]
+
+        # The parsed docstring is used if it is available
+        m["d"].docstring.parsed[0].value = "Changed"
+        assert describe_object(m["d"]) == "Changed"
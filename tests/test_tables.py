@@ -0,0 +1,39 @@
+import random
+
+from tabulate import tabulate
+
+from qrenderer._pandoc.tables import grid_table
+
+
+def test_grid_table_matches_tabulate():
+    headers = ("Name", "Description")
+    rows = [
+        ["[func](`package.func`)", "A function"],
+        ["[Class](`package.Class`)", None],
+        ["[_private](`package._private`)", "  Padded description  "],
+        ["[日本](`package.日本`)", "Wide characters, é and ü"],
+        ["[x](`package.x`)", ""],
+    ]
+    multiline_rows = [*rows, ["[y](`package.y`)", "Two\n  lines"]]
+
+    for rs in (rows, multiline_rows, rows[:1], []):
+        assert grid_table(rs, headers) == tabulate(rs, headers, "grid")
+        assert grid_table(rs) == tabulate(rs, tablefmt="grid")
+
+    # A summary row always has a name. Unlike tabulate, grid_table does
+    # not align the cells in columns that look like numbers or booleans
+    # (e.g. all "1", "True" or only whitespace) differently, so these are
+    # not generated.
+    rng = random.Random(123)
+    names = ["a", "bb", "[c](#c)", "*d*", "日", "é"]
+    words = [*names, " ", "\n"]
+    for _ in range(500):
+        rs = [
+            [
+                "".join(rng.choices(names, k=rng.randint(1, 3))),
+                "".join(rng.choices(words, k=rng.randint(0, 4))),
+            ]
+            for _ in range(rng.randint(1, 5))
+        ]
+        rs = [[name, desc if desc.strip() else ""] for name, desc in rs]
+        assert grid_table(rs, headers) == tabulate(rs, headers, "grid")
@@ -0,0 +1,71 @@
+import griffe as gf
+
+from qrenderer import QRenderer
+from qrenderer.tools import (
+    _render,
+    render_code_variables,
+    render_type_object,
+    render_type_objects,
+)
+
+code_a = '''
+from dataclasses import dataclass
+
+__all__ = ["Base", "Data"]
+
+class Base:
+    """
+    Base class
+    """
+
+    def method(self, a: int) -> int:
+        """
+        Base method
+        """
+
+@dataclass
+class Data(Base):
+    """
+    Data class
+
+    Parameters
+    ----------
+    x :
+        Parameter x
+    """
+
+    x: int = 1
+'''
+
+code_b = '''
+def func(b: str = "b"):
+    """
+    Function B
+    """
+'''
+
+
+def test_render_code_variables():
+    snippets = [(code_a, "Data"), (code_b, "func"), (code_a, None)]
+
+    def render_in_package(code: str, name: str | None) -> str:
+        with gf.temporary_visited_package(
+            "package", {"__init__.py": code}, docstring_parser="numpy"
+        ) as m:
+            return _render(m[name] if name else m)
+
+    qmds = render_code_variables(snippets)
+    assert qmds == [render_in_package(*s) for s in snippets]
+    assert "Data(x=1)" in qmds[0]
+    assert 'func(b="b")' in qmds[1]
+
+
+def test_render_type_objects():
+    paths = [QRenderer, "qrenderer.tools.render_code_variables", "json.dumps"]
+    expected = {
+        "qrenderer._qrenderer.QRenderer": render_type_object(QRenderer),
+        "qrenderer.tools.render_code_variables": render_type_object(paths[1]),
+        "json.dumps": render_type_object("json.dumps"),
+    }
+    assert render_type_objects(paths) == expected
+    assert render_type_objects(paths, jobs=2) == expected
@@ -0,0 +1,109 @@
+import pickle
+
+import griffe as gf
+from quartodoc import layout
+
+from qrenderer._utils import (
+    dispatchmethod,
+    griffe_to_doc,
+    write_if_changed,
+)
+
+
+def test_griffe_to_doc():
+    code = '''
+    class Base:
+        """
+        Base class
+        """
+
+        def method(self):
+            """
+            Base method
+            """
+
+    class Derived(Base):
+        """
+        Derived class
+        """
+
+        class Nested:
+            """
+            Nested class
+            """
+    '''
+    with gf.temporary_visited_package(
+        "package", {"__init__.py": code}, docstring_parser="numpy"
+    ) as m:
+        doc = griffe_to_doc(m["Derived"])
+        assert isinstance(doc, layout.DocClass)
+        assert doc.anchor == "package.Derived"
+
+        # The members are converted when they are accessed
+        assert "_members" not in vars(doc.members)
+        assert [x.name for x in doc.members] == ["method", "Nested"]
+        assert "_members" in vars(doc.members)
+        assert doc.members[0].anchor == "package.Derived.method"
+        assert doc.members[0].obj.canonical_path == "package.Base.method"
+
+        # Without aliases, the inherited members are left out
+        doc = griffe_to_doc(m["Derived"], aliases=False)
+        assert [x.name for x in doc.members] == ["Nested"]
+
+        # The members are pickled as a list
+        members = pickle.loads(pickle.dumps(doc.members))
+        assert isinstance(members, list)
+        assert members[0].name == "Nested"
+
+
+def test_griffe_to_doc_cycle():
+    with gf.temporary_visited_package(
+        "package",
+        {
+            "__init__.py": "from package import sub",
+            "sub.py": "import package",
+        },
+    ) as m:
+        doc = griffe_to_doc(m)
+        (sub,) = doc.members
+        assert sub.name == "sub"
+        assert len(sub.members) == 0
+
+
+def test_dispatchmethod():
+    class A:
+        @dispatchmethod
+        def f(self, x: object) -> str:
+            return "object"
+
+        @f.register
+        def _(self, x: int) -> str:
+            return "int"
+
+    a = A()
+    assert a.f(1) == "int"
+    assert a.f(True) == "int"
+    assert a.f("a") == "object"
+
+    # Registering a type after a dispatch
+    @A.f.register
+    def _(self, x: bool) -> str:
+        return "bool"
+
+    assert a.f(True) == "bool"
+
+    A.f.register(str, staticmethod(lambda x: "str"))
+    assert a.f("a") == "str"
+
+
+def test_write_if_changed(tmp_path):
+    filepath = tmp_path / "dir/page.qmd"
+    assert write_if_changed(filepath, "content")
+    mtime = filepath.stat().st_mtime_ns
+
+    assert not write_if_changed(filepath, "content")
+    assert filepath.stat().st_mtime_ns == mtime
+
+    assert write_if_changed(filepath, "new content")
+    assert filepath.read_text() == "new content"
+    assert [p.name for p in filepath.parent.iterdir()] == ["page.qmd"]
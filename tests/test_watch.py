@@ -0,0 +1,62 @@
+from textwrap import dedent
+
+from qrenderer import QRenderer
+from qrenderer._cli import config_directory, load_builder
+from qrenderer._watch import Watcher
+
+code = '''
+def func_a(a: int = 1):
+    """
+    Function A
+    """
+
+def func_b(b: str = "b"):
+    """
+    Function B
+    """
+'''
+
+config = """
+quartodoc:
+  dir: reference
+  package: package
+  sections:
+    - title: Functions
+      contents:
+        - func_a
+        - func_b
+"""
+
+
+def test_watcher(tmp_path, monkeypatch):
+    init = tmp_path / "package/__init__.py"
+    init.parent.mkdir()
+    init.write_text(dedent(code))
+    config_path = tmp_path / "_quarto.yml"
+    config_path.write_text(config)
+    options = {"incremental": True, "cache_dir": str(tmp_path / "cache")}
+
+    rendered: list[str] = []
+    render_page = QRenderer._render_page
+
+    def _render_page(self, el):
+        rendered.append(el.path)
+        return render_page(self, el)
+
+    monkeypatch.setattr(QRenderer, "_render_page", _render_page)
+
+    with config_directory(config_path):
+        watcher = Watcher(load_builder(config_path, options), config_path)
+        watcher.build()
+        assert sorted(rendered) == ["func_a", "func_b"]
+        assert watcher.snapshot().keys() == {config_path, init}
+
+        # Only the page of the changed object is rendered again
+        rendered.clear()
+        init.write_text(dedent(code.replace("Function B", "Function BB")))
+        assert watcher.changed_packages([init]) == {"package"}
+        watcher.reload({"package"})
+        watcher.build()
+        assert rendered == ["func_b"]
+        qmd = (tmp_path / "reference/func_b.qmd").read_text()
+        assert "Function BB" in qmd
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+import griffe as gf
+from quartodoc import layout
+
+from qrenderer._utils import griffe_to_doc
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from qrenderer import QRenderer
+
+
+@contextmanager
+def visited_pages(
+    code: str, names: Sequence[str], aliases: bool = True
+) -> Iterator[list[layout.Page]]:
+    """
+    Visit code as the package `package` and yield a page for each object
+
+    Parameters
+    ----------
+    code :
+        Source of the `__init__.py` of the package
+    names :
+        Names of the objects in the package to create pages for
+    aliases :
+        Whether to document the members that are aliases e.g. the
+        inherited members of classes.
+    """
+    with gf.temporary_visited_package(
+        "package", {"__init__.py": code}, docstring_parser="numpy"
+    ) as m:
+        yield [
+            layout.Page(path=name, contents=[griffe_to_doc(m[name], aliases)])
+            for name in names
+        ]
+
+
+def render_pages(
+    renderer: QRenderer, code: str, names: Sequence[str]
+) -> list[tuple[str, set[str]]]:
+    """
+    Render the pages of objects without consulting the page cache
+
+    Returns
+    -------
+    :
+        The rendered pages and their dependencies
+    """
+    with visited_pages(code, names) as pages:
+        return [
+            renderer._render_page(page)  # pyright: ignore[reportPrivateUsage]
+            for page in pages
+        ]